@@ -1,6 +1,7 @@
 """Preset setup files."""
 # Standard library
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Collection
 from typing import Dict
@@ -8,6 +9,7 @@ from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Pattern
+from typing import Tuple
 from typing import Union
 
 # Local
@@ -42,30 +44,39 @@ def collect_preset_paths() -> Iterator[Path]:
 
 
 def compile_patterns(patterns: Collection[str]) -> List[Pattern]:
-    rx_patterns = []
-    for pattern in patterns:
-        ch = "[a-zA-Z0-9_./-]"
-        rx_pattern = re.compile(
-            r"\A" + pattern.replace("*", f"{ch}*").replace("?", ch) + r"\Z"
-        )
-        rx_patterns.append(rx_pattern)
-    return rx_patterns
+    return [_compile_pattern(pattern) for pattern in patterns]
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Pattern:
+    """Turn a preset name pattern with wildcards into a regular expression."""
+    ch = "[a-zA-Z0-9_./-]"
+    return re.compile(r"\A" + pattern.replace("*", f"{ch}*").replace("?", ch) + r"\Z")
 
 
 def collect_preset_files(
-    patterns: Collection[str] = "*", antipatterns: Optional[Collection[str]] = None
+    patterns: Collection[str] = "*",
+    antipatterns: Optional[Collection[str]] = None,
+    cache: Optional[Dict[Path, List[Tuple[str, Path]]]] = None,
 ) -> Dict[Path, Dict[str, Path]]:
-    """Collect all setup files in locations specified in ``preset_paths``."""
+    """Collect all setup files in locations specified in ``preset_paths``.
+
+    Args:
+        patterns (optional): Patterns of preset names to collect.
+
+        antipatterns (optional): Patterns of preset names to skip.
+
+        cache (optional): Dict in which the setup files found in each preset
+            path are stored; pass the same dict to multiple calls to only
+            traverse each preset path once.
+
+    """
     rx_patterns = compile_patterns(patterns)
     rx_antipatterns = [] if antipatterns is None else compile_patterns(antipatterns)
     files_by_preset_path = {}  # type: ignore
     for preset_path in collect_preset_paths():
         files_by_preset_path[preset_path] = {}
-        for file_path in sorted(preset_path.rglob("*.toml")):
-            if file_path.name.startswith("_"):
-                continue
-            file_path_rel = file_path.relative_to(preset_path)
-            name = str(file_path_rel)[: -len(file_path.suffix)]
+        for name, file_path in _list_preset_files(preset_path, cache):
             for rx in rx_antipatterns:
                 if rx.match(name):
                     break
@@ -78,6 +89,24 @@ def collect_preset_files(
     return files_by_preset_path
 
 
+def _list_preset_files(
+    preset_path: Path, cache: Optional[Dict[Path, List[Tuple[str, Path]]]] = None
+) -> List[Tuple[str, Path]]:
+    """List the names and paths of all setup files in a preset path."""
+    if cache is not None and preset_path in cache:
+        return cache[preset_path]
+    named_paths: List[Tuple[str, Path]] = []
+    for file_path in sorted(preset_path.rglob("*.toml")):
+        if file_path.name.startswith("_"):
+            continue
+        file_path_rel = file_path.relative_to(preset_path)
+        name = str(file_path_rel)[: -len(file_path.suffix)]
+        named_paths.append((name, file_path))
+    if cache is not None:
+        cache[preset_path] = named_paths
+    return named_paths
+
+
 def collect_preset_files_flat(pattern: str) -> Dict[str, Path]:
     files_by_dir = collect_preset_files([pattern])
     named_paths = {
@@ -3,8 +3,11 @@
 import sys
 from pathlib import Path
 from typing import Any
+from typing import Dict
+from typing import List
 from typing import Mapping
 from typing import Sequence
+from typing import Tuple
 
 # Third-party
 import click
@@ -52,10 +55,15 @@ def click_use_preset(ctx: Context, param: ClickParamType, value: Any) -> None:
     key = "preset_setup_file_paths"
     if key not in ctx.obj:
         ctx.obj[key] = []
+    paths_set = set(ctx.obj[key])
 
+    # Traverse the preset paths only once for all patterns
+    cache: Dict[Path, List[Tuple[str, Path]]] = {}
     for pattern in patterns:
         try:
-            files_by_preset_path = collect_preset_files([pattern], antipatterns)
+            files_by_preset_path = collect_preset_files(
+                [pattern], antipatterns, cache=cache
+            )
         except NoPresetFileFoundError as e:
             msg = f"no preset setup file found for '{pattern}'"
             if ctx.obj["raise"]:
@@ -75,8 +83,9 @@ def click_use_preset(ctx: Context, param: ClickParamType, value: Any) -> None:
             _click_list_presets(ctx, files_by_preset_path, indent_all=True)
         for files in files_by_preset_path.values():
             for path in files.values():
-                if path not in ctx.obj[key]:
+                if path not in paths_set:
                     ctx.obj[key].append(path)
+                    paths_set.add(path)
 
 
 def _click_list_presets(
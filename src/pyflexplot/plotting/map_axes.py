@@ -4,6 +4,8 @@ from __future__ import annotations
 # Standard library
 import dataclasses as dc
 import warnings
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 from typing import Dict
 from typing import List
@@ -19,6 +21,7 @@ import matplotlib as mpl
 import numpy as np
 from cartopy.io.shapereader import Record  # type: ignore
 from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 from matplotlib.text import Text
@@ -131,6 +134,25 @@ class MapAxesConfig:
 class MapAxes:
     """Map plot axes for regular lat/lon data."""
 
+    # Zorder of unique plot elements, from low to high (shared and read-only)
+    _zorder: Mapping[str, int] = MappingProxyType(
+        {
+            "lowest": 1,
+            "fld": 2,
+            "geo_lower": 3,
+            "geo_upper": 4,
+            "grid": 5,
+            "marker": 6,
+            "frames": 7,
+        }
+    )
+
+    # Default keyword arguments for text added with ``add_text``
+    _text_kwargs_default: Dict[str, Any] = {
+        "xytext": (5, 1),
+        "textcoords": "offset points",
+    }
+
     def __init__(
         self,
         *,
@@ -169,8 +191,7 @@ class MapAxes:
 
         self._water_color: ColorType = "lightskyblue"
 
-        self.zorder: Dict[str, int]
-        self._init_zorder()
+        self.zorder: Mapping[str, int] = self._zorder
 
         # SR_TMP <<< TODO Clean this up!
         def _create_ax(
@@ -207,6 +228,13 @@ class MapAxes:
             proj_data=self.projs.data,
         )
 
+        # Transform from geographic to display coordinates used to add text
+        # pylint: disable=W0212  # protected-access
+        # pylint: disable=E1101  # no-member [pylint 2.7.4]
+        # (pylint 2.7.4 does not support dataclasses.field)
+        # -> see https://stackoverflow.com/a/25421922/4419816
+        self._geo_mpl_transform = self.trans.proj_geo._as_mpl_transform(self.ax)
+
         self.ref_dist_box: Optional[
             ReferenceDistanceIndicator
         ] = self._init_ref_dist_box()
@@ -252,6 +280,40 @@ class MapAxes:
         )
         return handle
 
+    def add_markers(
+        self,
+        *,
+        p_lons: Sequence[float],
+        p_lats: Sequence[float],
+        marker: str,
+        zorder: Optional[int] = None,
+        **kwargs,
+    ) -> PathCollection:
+        """Add multiple markers at once at locations in natural coordinates."""
+        if zorder is None:
+            zorder = self.zorder["marker"]
+        handle = self.ax.scatter(
+            p_lons,
+            p_lats,
+            marker=marker,
+            transform=self.trans.proj_geo,
+            zorder=zorder,
+            **kwargs,
+        )
+        self.element_handles.append(handle)
+        self.elements.append(
+            {
+                "element_type": "markers",
+                "p_lon": np.asarray(p_lons).tolist(),
+                "p_lat": np.asarray(p_lats).tolist(),
+                "marker": marker,
+                "transform": f"{type(self.trans.proj_geo).__name__} instance",
+                "zorder": zorder,
+                **kwargs,
+            }
+        )
+        return handle
+
     def add_text(
         self,
         p_lon: float,
@@ -281,13 +343,8 @@ class MapAxes:
         """
         if zorder is None:
             zorder = self.zorder["geo_lower"]
-        kwargs_default = {"xytext": (5, 1), "textcoords": "offset points"}
-        kwargs = {**kwargs_default, **kwargs}
-        # pylint: disable=W0212  # protected-access
-        # pylint: disable=E1101  # no-member [pylint 2.7.4]
-        # (pylint 2.7.4 does not support dataclasses.field)
-        transform = self.trans.proj_geo._as_mpl_transform(self.ax)
-        # -> see https://stackoverflow.com/a/25421922/4419816
+        kwargs = {**self._text_kwargs_default, **kwargs}
+        transform = self._geo_mpl_transform
         handle = self.ax.annotate(
             s, xy=(p_lon, p_lat), xycoords=transform, zorder=zorder, **kwargs
         )
@@ -307,20 +364,6 @@ class MapAxes:
     def __repr__(self) -> str:
         return f"{type(self).__name__}(<TODO>)"  # SR_TODO
 
-    def _init_zorder(self) -> None:
-        """Determine zorder of unique plot elements, from low to high."""
-        zorders_const = [
-            "frames",
-            "marker",
-            "grid",
-            "geo_upper",
-            "geo_lower",
-            "fld",
-            "lowest",
-        ][::-1]
-        d0, dz = 1, 1
-        self.zorder = {name: d0 + idx * dz for idx, name in enumerate(zorders_const)}
-
     def _init_ref_dist_box(self) -> Optional[ReferenceDistanceIndicator]:
         """Initialize the reference distance indicator (if activated)."""
         if not self.config.ref_dist_on:
@@ -344,39 +387,41 @@ class MapAxes:
         gl = self.ax.gridlines(
             linestyle=":", linewidth=1, color="black", zorder=self.zorder["grid"]
         )
-        gl.xlocator = mpl.ticker.FixedLocator(
-            np.arange(-180, 180, self.config.d_lon_grid)
-        )
-        gl.ylocator = mpl.ticker.FixedLocator(
-            np.arange(-90, 90.1, self.config.d_lat_grid)
-        )
+        gl.xlocator = _get_lon_grid_locator(self.config.d_lon_grid)
+        gl.ylocator = _get_lat_grid_locator(self.config.d_lat_grid)
 
     def _ax_add_geography(self) -> None:
         """Add geographic elements: coasts, countries, colors, etc."""
         self.ax.coastlines(resolution=self.config.geo_res)
         self.ax.patch.set_facecolor(self._water_color)
-        self._ax_add_countries("lowest", rasterized=True)
+        # The country layers only differ in style, so they share one feature
+        countries = cartopy.feature.NaturalEarthFeature(
+            category="cultural",
+            name="admin_0_countries_lakes",
+            scale=self.config.geo_res,
+        )
+        self._ax_add_countries(countries, "lowest", rasterized=True)
         self._ax_add_lakes("lowest", rasterized=True)
         self._ax_add_rivers("lowest", rasterized=True)
-        self._ax_add_countries("geo_lower", rasterized=True)
-        self._ax_add_countries("geo_upper", rasterized=True)
+        self._ax_add_countries(countries, "geo_lower", rasterized=True)
+        self._ax_add_countries(countries, "geo_upper", rasterized=True)
         self._ax_add_cities("geo_upper", rasterized=False)
 
-    def _ax_add_countries(self, zorder_key: str, rasterized: bool = False) -> None:
+    def _ax_add_countries(
+        self,
+        countries: cartopy.feature.Feature,
+        zorder_key: str,
+        rasterized: bool = False,
+    ) -> None:
         edgecolor = "white" if zorder_key == "geo_lower" else "black"
         facecolor = "white" if zorder_key == "lowest" else "none"
         linewidth = 1 / 3 if zorder_key == "geo_upper" else 1
         self.ax.add_feature(
-            cartopy.feature.NaturalEarthFeature(
-                category="cultural",
-                name="admin_0_countries_lakes",
-                scale=self.config.geo_res,
-                edgecolor=edgecolor,
-                facecolor=facecolor,
-                linewidth=linewidth * self.config.scale_fact,
-                rasterized=rasterized,
-            ),
+            countries,
             zorder=self.zorder[zorder_key],
+            edgecolor=edgecolor,
+            facecolor=facecolor,
+            linewidth=linewidth * self.config.scale_fact,
             rasterized=rasterized,
         )
 
@@ -443,7 +488,7 @@ class MapAxes:
         """Add major cities, incl. all capitals."""
         all_capitals = self.config.all_capital_cities
         only_capitals = self.config.only_capital_cities
-        excluded_names = np.array(self.config.exclude_cities, dtype=np.str_)
+        excluded_names = set(self.config.exclude_cities)
 
         def get_name(city: Record) -> str:
             """Get city name in current language, hand-correcting some."""
@@ -460,108 +505,86 @@ class MapAxes:
             """Get city population."""
             return city.attributes["GN_POP"]
 
-        def get_lon(city: Record) -> np.ndarray:
-            """Get the city longitude."""
-            return city.geometry.x
-
-        def get_lat(city: Record) -> np.ndarray:
-            """Get the city latitude."""
-            return city.geometry.y
-
-        def is_in_domain(px_ax: float, py_ax: float) -> bool:
-            """Check if point is in domain."""
-            return 0.0 <= px_ax <= 1.0 and 0.0 <= py_ax <= 1.0
-
-        def is_behind_ref_dist_box(px_ax: float, py_ax: float) -> bool:
-            """Check if point is behind reference distance box."""
-            if self.ref_dist_box is None:
-                return False
-            return (
-                self.ref_dist_box.x0_box <= px_ax <= self.ref_dist_box.x1_box
-                and self.ref_dist_box.y0_box <= py_ax <= self.ref_dist_box.y1_box
-            )
-
-        np_get_name = np.frompyfunc(get_name, 1, 1)
-        np_is_capital = np.frompyfunc(is_capital, 1, 1)
-        np_get_population = np.frompyfunc(get_population, 1, 1)
-        np_get_lon = np.frompyfunc(get_lon, 1, 1)
-        np_get_lat = np.frompyfunc(get_lat, 1, 1)
-        np_is_in_domain = np.frompyfunc(is_in_domain, 2, 1)
-        np_is_behind_ref_dist_box = np.frompyfunc(is_behind_ref_dist_box, 2, 1)
-
         # src: https://www.naturalearthdata.com/downloads/50m-cultural-vectors/...
         # .../50m-populated-places/lk
-        cities = np.array(
-            list(
-                cartopy.io.shapereader.Reader(
-                    cartopy.io.shapereader.natural_earth(
-                        category="cultural",
-                        name="populated_places",
-                        resolution=self.config.geo_res_cities,
-                    )
-                ).records()
-            )
+        cities = _load_natural_earth_records(
+            category="cultural",
+            name="populated_places",
+            resolution=self.config.geo_res_cities,
         )
 
-        # Select cities of interest
-        capitals = np_is_capital(cities).astype(np.bool_)
-        populations = np_get_population(cities).astype(np.int32)
+        # Extract city attributes in a single pass (structure of arrays); the
+        # records themselves are only referred to by index into ``cities``
+        n_cities = len(cities)
+        lons = np.fromiter((city.geometry.x for city in cities), np.float32, n_cities)
+        lats = np.fromiter((city.geometry.y for city in cities), np.float32, n_cities)
+
+        # Select cities of interest (only extracting the attributes needed)
+        if all_capitals or only_capitals:
+            capitals = np.fromiter(map(is_capital, cities), np.bool_, n_cities)
+        if not (all_capitals and only_capitals):
+            populations = np.fromiter(map(get_population, cities), np.int32, n_cities)
+            populous = populations > self.config.min_city_pop
         if all_capitals and only_capitals:
             selected = capitals
         elif all_capitals and not only_capitals:
-            selected = capitals | (populations > self.config.min_city_pop)
+            selected = capitals | populous
         elif not all_capitals and only_capitals:
-            selected = capitals & (populations > self.config.min_city_pop)
+            selected = capitals & populous
         elif not all_capitals and not only_capitals:
-            selected = populations > self.config.min_city_pop
-        cities = cities[selected]
+            selected = populous
 
         # Pre-select cities in and around domain
-        lons = np_get_lon(cities).astype(np.float32)
-        lats = np_get_lat(cities).astype(np.float32)
         lon_min, lat_min, lon_max, lat_max = self._get_domain_bbox()
-        in_domain = (
+        selected = selected & (
             (lons > lon_min) & (lons < lon_max) & (lats > lat_min) & (lats < lat_max)
         )
-        cities = cities[in_domain]
+        idx = np.nonzero(selected)[0]
+        if idx.size == 0:
+            return
+        lons, lats = lons[idx], lats[idx]
 
         # Select visible cities
-        lons = np_get_lon(cities).astype(np.float32)
-        lats = np_get_lat(cities).astype(np.float32)
         # pylint: disable=E0633  # unpacking-non-sequence (false negative?!?)
         xs, ys = self.trans.geo_to_axes(lons, lats)
-        in_domain = np_is_in_domain(xs, ys).astype(np.bool_)
-        behind_ref_dist_box = np_is_behind_ref_dist_box(xs, ys).astype(np.bool_)
-        visible = in_domain & ~behind_ref_dist_box
-        cities = cities[visible]
-
-        # Sort cities by name
-        names = np_get_name(cities).astype(np.str_)
-        sorted_inds = names.argsort()
-        names = names[sorted_inds]
-        cities = cities[sorted_inds]
-
-        # Exclude certain cities by name
-        excluded = np.in1d(names, excluded_names)
-        cities = cities[~excluded]
-
+        in_domain = (xs >= 0.0) & (xs <= 1.0) & (ys >= 0.0) & (ys <= 1.0)
+        if self.ref_dist_box is None:
+            visible = in_domain
+        else:
+            x0, x1 = self.ref_dist_box.x0_box, self.ref_dist_box.x1_box
+            y0, y1 = self.ref_dist_box.y0_box, self.ref_dist_box.y1_box
+            behind_ref_dist_box = (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+            visible = in_domain & ~behind_ref_dist_box
+        idx, lons, lats = idx[visible], lons[visible], lats[visible]
+        if idx.size == 0:
+            return
+
+        # Exclude certain cities by name and sort the remaining ones by name
+        names = (get_name(cities[i]) for i in idx.tolist())
+        entries = [
+            (name, lon, lat)
+            for name, lon, lat in zip(names, lons.tolist(), lats.tolist())
+            if name not in excluded_names
+        ]
+        if not entries:
+            return
+        entries.sort(key=lambda entry: entry[0])
+
+        self.add_markers(
+            p_lons=[lon for _, lon, _ in entries],
+            p_lats=[lat for _, _, lat in entries],
+            marker="o",
+            s=(3 * self.config.scale_fact) ** 2,
+            facecolors="none",
+            edgecolors="black",
+            linewidths=1 * self.config.scale_fact,
+            zorder=self.zorder[zorder_key],
+            rasterized=rasterized,
+        )
         plot_domain = mpl.patches.Rectangle(
             xy=(0, 0), width=1.0, height=1.0, transform=self.ax.transAxes
         )
-        for city in cities:
-            lon, lat = city.geometry.x, city.geometry.y
-            name = get_name(city)
-            self.add_marker(
-                p_lat=lat,
-                p_lon=lon,
-                marker="o",
-                color="black",
-                fillstyle="none",
-                markeredgewidth=1 * self.config.scale_fact,
-                markersize=3 * self.config.scale_fact,
-                zorder=self.zorder[zorder_key],
-                rasterized=rasterized,
-            )
+        for name, lon, lat in entries:
             text = self.add_text(
                 lon,
                 lat,
@@ -603,13 +626,38 @@ class MapAxes:
         self, n: int = 20, pad: float = 1.0
     ) -> tuple[float, float, float, float]:
         """Get ``(lon0, lat0, lon1, lat1)`` bounding box of domain."""
-        trans = self.trans.axes_to_geo
-        lons_s, lats_s = trans(np.linspace(0, 1, n), np.full([n], 0))
-        lons_n, lats_n = trans(np.linspace(0, 1, n), np.full([n], 1))
-        lons_w, lats_w = trans(np.full([n], 0), np.linspace(0, 1, n))
-        lons_e, lats_e = trans(np.full([n], 1), np.linspace(0, 1, n))
-        lon_min = min([lons_s.min(), lons_n.min(), lons_w.min(), lons_e.min()])
-        lat_min = min([lats_s.min(), lats_n.min(), lats_w.min(), lats_e.min()])
-        lon_max = max([lons_s.max(), lons_n.max(), lons_w.max(), lons_e.max()])
-        lat_max = max([lats_s.max(), lats_n.max(), lats_w.max(), lats_e.max()])
+        # Transform all four edges (S, N, W, E) at once
+        lin = np.linspace(0, 1, n)
+        zeros, ones = np.zeros(n), np.ones(n)
+        lons, lats = self.trans.axes_to_geo(
+            np.concatenate([lin, lin, zeros, ones]),
+            np.concatenate([zeros, ones, lin, lin]),
+        )
+        lon_min, lon_max = lons.min(), lons.max()
+        lat_min, lat_max = lats.min(), lats.max()
         return (lon_min - pad, lat_min - pad, lon_max + pad, lat_max + pad)
+
+
+@lru_cache(maxsize=32)
+def _load_natural_earth_records(
+    category: str, name: str, resolution: str
+) -> Tuple[Record, ...]:
+    """Read the records of a Natural Earth shapefile only once per session."""
+    path = cartopy.io.shapereader.natural_earth(
+        category=category, name=name, resolution=resolution
+    )
+    return tuple(cartopy.io.shapereader.Reader(path).records())
+
+
+# Note: The locators can be shared between axes because the gridliner only
+# uses them to compute tick values, which does not alter their state
+@lru_cache(maxsize=16)
+def _get_lon_grid_locator(d_lon: float) -> mpl.ticker.FixedLocator:
+    """Get locator of longitudinal grid lines at a given interval."""
+    return mpl.ticker.FixedLocator(np.arange(-180, 180, d_lon))
+
+
+@lru_cache(maxsize=16)
+def _get_lat_grid_locator(d_lat: float) -> mpl.ticker.FixedLocator:
+    """Get locator of latitudinal grid lines at a given interval."""
+    return mpl.ticker.FixedLocator(np.arange(-90, 90.1, d_lat))
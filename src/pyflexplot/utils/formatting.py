@@ -1,9 +1,11 @@
 """Formatting utilities."""
 # Standard library
-import dataclasses as dc
 import re
 import warnings
+from functools import lru_cache
+from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
@@ -15,10 +17,29 @@ import numpy as np
 # First-party
 from srutils.format import format_numbers_range
 
+# Valid format strings for exponential or floating point notation
+_RX_EF = re.compile(r"^{f:[0-9,]*\.?[0-9]*[eEf]}$")
+
+# Trailing zeros of a number, except for the first fractional digit
+_RX_TRAILING_ZEROS = re.compile(r"(?<!\.)0+\b(?!\.)")
+
+_RX_ENS_PATH = re.compile(
+    r"(?P<start>.*)(?P<pattern>{ens_member(:(?P<fmt>[0-9]*d?))?})(?P<end>.*)"
+)
+
+_BRACE_ESCAPES = str.maketrans({"{": "{{", "}": "}}"})
+
+_INF = float("inf")
+
 
 def check_float_ok(f: float, ff0t: str) -> bool:
     if f != np.inf and f >= 1.0:
-        return bool(re.match(f"^{int(f)}" + r"\.[0-9]+$", ff0t))
+        # Integer part followed by a non-empty fractional part
+        prefix = f"{int(f)}."
+        if not ff0t.startswith(prefix):
+            return False
+        decimals = ff0t[len(prefix) :]
+        return decimals.isascii() and decimals.isdigit()
     return (f == 0.0) or (float(ff0t) != 0.0)
 
 
@@ -92,13 +113,24 @@ def format_float(
 
     """
     f = float(f)
+    if f == 0.0:
+        # Bypass the cache, which does not distinguish between 0.0 and -0.0
+        return _format_float.__wrapped__(f, fmt_e0, fmt_f0, fmt_e1, fmt_f1)
+    return _format_float(f, fmt_e0, fmt_f0, fmt_e1, fmt_f1)
 
-    rx_e = re.compile(r"^{f:[0-9,]*\.?[0-9]*[eE]}$")
-    rx_f = re.compile(r"^{f:[0-9,]*\.?[0-9]*f}$")
-    for fmt in [fmt_e0, fmt_f0, fmt_e1, fmt_f1]:
-        if fmt is not None:
-            if not rx_e.match(fmt) and not rx_f.match(fmt):
-                raise ValueError(f"invalid format string: '{fmt}'", fmt)
+
+@lru_cache(maxsize=1024)
+def _format_float(
+    f: float,
+    fmt_e0: Optional[str],
+    fmt_f0: Optional[str],
+    fmt_e1: Optional[str],
+    fmt_f1: Optional[str],
+) -> str:
+    """Format a float; see ``format_float`` for details."""
+    for fmt in (fmt_e0, fmt_f0, fmt_e1, fmt_f1):
+        if fmt is not None and not _RX_EF.match(fmt):
+            raise ValueError(f"invalid format string: '{fmt}'", fmt)
 
     if fmt_e0 is None:
         fmt_e0 = "{f:e}"
@@ -207,25 +239,27 @@ def format_level_ranges(
         "and": LevelRangeFormatterAnd,
         "var": LevelRangeFormatterVar,
     }
-    try:
-        cls = formatters[style]
-    except AttributeError as e:
-        raise ValueError(
-            f"unknown style '{style}'; options: {sorted(formatters)}"
-        ) from e
-    else:
-        formatter = cls(
-            widths=widths, extend=extend, align=align, include=include, **kwargs
-        )
+    cls = formatters.get(style)
+    if cls is None:
+        raise ValueError(f"unknown style '{style}'; options: {sorted(formatters)}")
+    formatter = cls(
+        widths=widths, extend=extend, align=align, include=include, **kwargs
+    )
     return formatter.format_multiple(levels)
 
 
 def escape_format_keys(s: str) -> str:
-    return s.replace("{", "{{").replace("}", "}}")
+    return s.translate(_BRACE_ESCAPES)
+
+
+def _rstrip_zeros(s: str) -> str:
+    """Remove trailing zeros unless in exponential notation."""
+    if "e" in s or "E" in s:
+        return s
+    return _RX_TRAILING_ZEROS.sub("", s)
 
 
-@dc.dataclass
-class Component:
+class Component(NamedTuple):
     """Auxiliary class to pass results between formatter methods."""
 
     s: str
@@ -234,6 +268,8 @@ class Component:
     @classmethod
     def create(cls, arg: Union[str, Tuple[str, int]]) -> "Component":
         if isinstance(arg, str):
+            if not arg:
+                return _EMPTY_COMPONENT
             s, ntex = arg, 0
         else:
             s = arg[0]
@@ -241,8 +277,11 @@ class Component:
         return cls(s, ntex)
 
 
-@dc.dataclass
-class Components:
+# Shared by all empty components (e.g., the left one of open-left ranges)
+_EMPTY_COMPONENT = Component("", 0)
+
+
+class Components(NamedTuple):
     """Auxiliary class to pass results between formatter methods."""
 
     left: Component
@@ -296,11 +335,39 @@ class LevelRangeFormatter:
         self.rstrip_zeros: bool = rstrip_zeros
         self.include: str = include
 
+        # Format spec alignment characters of left and right components
+        self._d_l: str
+        self._d_r: str
+        if align == "left":
+            self._d_l, self._d_r = "<", "<"
+        elif align == "right":
+            self._d_l, self._d_r = ">", ">"
+        elif align == "center":
+            self._d_l, self._d_r = "<", ">"
+        elif align == "edges":
+            self._d_l, self._d_r = "<", "<"
+        else:
+            raise Exception(f"invalid value: align='{align}'")
+
+        # Operators of ranges open to the left and right
+        self._op_open_left: str
+        self._op_open_right: str
+        if include == "lower":
+            self._op_open_left, self._op_open_right = r"$\tt <$", r"$\tt \geq$"
+        elif include == "upper":
+            self._op_open_left, self._op_open_right = r"$\tt \leq$", r"$\tt >$"
+        else:
+            raise Exception(f"wrong value of include: '{include}'")
+
         # Declare attributes
         self._max_val: Optional[float] = None
+        self._levels_fmtd: Dict[Tuple[type, float], str] = {}
 
         self._check_widths(self.widths)
 
+        # Label template for components without TeX characters
+        self._template_no_tex: str = self._create_template(0, 0, 0)
+
     @staticmethod
     def _check_widths(widths: Tuple[int, int, int]) -> None:
         try:
@@ -311,7 +378,11 @@ class LevelRangeFormatter:
 
     def format_multiple(self, levels: Sequence[float]) -> List[str]:
         labels: List[str] = []
-        self._max_val = max(levels)
+        if isinstance(levels, np.ndarray):
+            self._set_max_val(levels.max())
+        else:
+            self._set_max_val(max(levels))
+        self._levels_fmtd = self._format_levels(levels)
         if self.extend in ("min", "both"):
             labels.append(self.format(None, levels[0]))
         for lvl0, lvl1 in zip(levels[:-1], levels[1:]):
@@ -320,11 +391,14 @@ class LevelRangeFormatter:
             labels.append(self.format(levels[-1], None))
         return labels
 
+    def _set_max_val(self, max_val: float) -> None:
+        self._max_val = max_val
+
     def format(self, lvl0: Optional[float], lvl1: Optional[float]) -> str:
         if self._max_val is None:
             assert lvl0 is not None
             assert lvl1 is not None
-            self._max_val = max([lvl0, lvl1])
+            self._set_max_val(max([lvl0, lvl1]))
 
         cs = self._format_components(lvl0, lvl1)
 
@@ -332,44 +406,32 @@ class LevelRangeFormatter:
         s_c = cs.center.s
         s_r = cs.right.s
 
-        d_c = "^"
-        if self.align == "left":
-            d_l, d_r = "<", "<"
-        elif self.align == "right":
-            d_l, d_r = ">", ">"
-        elif self.align == "center":
-            d_l, d_r = "<", ">"
-        elif self.align == "edges":
-            d_l, d_r = "<", "<"
-        else:
-            raise Exception(f"invalid value: self.align='{self.align}'")
-
         if self.rstrip_zeros:
+            s_l = _rstrip_zeros(s_l)
+            s_r = _rstrip_zeros(s_r)
 
-            def rstrip_zeros(s):
-                if "e" in s or "E" in s:
-                    return s
-                rx_str = r"(?<!\.)0\b(?!\.)"
-                while re.search(rx_str, s):
-                    s = re.sub(rx_str, "", s)
-                return s
-
-            s_l = rstrip_zeros(s_l)
-            s_r = rstrip_zeros(s_r)
+        if cs.left.ntex or cs.center.ntex or cs.right.ntex:
+            template = self._create_template(
+                cs.left.ntex, cs.center.ntex, cs.right.ntex
+            )
+        else:
+            template = self._template_no_tex
+        return template.format(s_l, s_c, s_r)
 
+    def _create_template(self, ntex_l: int, ntex_c: int, ntex_r: int) -> str:
+        """Create label template, widened by the number of TeX characters."""
         wl, wc, wr = self.widths
-
-        s_l = f"{{:{d_l}{wl + cs.left.ntex}}}".format(s_l)
-        s_c = f"{{:{d_c}{wc + cs.center.ntex}}}".format(s_c)
-        s_r = f"{{:{d_r}{wr + cs.right.ntex}}}".format(s_r)
-
-        return f"{s_l}{s_c}{s_r}"
+        return (
+            f"{{:{self._d_l}{wl + ntex_l}}}"
+            f"{{:^{wc + ntex_c}}}"
+            f"{{:{self._d_r}{wr + ntex_r}}}"
+        )
 
     def _format_components(
         self, lvl0: Optional[float], lvl1: Optional[float]
     ) -> Components:
-        open_left = lvl0 in (None, np.inf)
-        open_right = lvl1 in (None, np.inf)
+        open_left = lvl0 is None or lvl0 == _INF
+        open_right = lvl1 is None or lvl1 == _INF
         if open_left and open_right:
             raise ValueError("range open at both ends")
         elif open_left:
@@ -383,8 +445,8 @@ class LevelRangeFormatter:
             return self._format_closed(lvl0, lvl1)
 
     def _format_closed(self, lvl0: float, lvl1: float) -> Components:
-        lvl0_fmtd = self._format_level(lvl0)
-        lvl1_fmtd = self._format_level(lvl1)
+        lvl0_fmtd = self._get_level_fmtd(lvl0)
+        lvl1_fmtd = self._get_level_fmtd(lvl1)
         op_fmtd = r"$\tt -$"
         ntex_c = len(op_fmtd) - 1
         s_l = lvl0_fmtd
@@ -393,30 +455,31 @@ class LevelRangeFormatter:
         return Components.create(s_l, (s_c, ntex_c), s_r)
 
     def _format_open_left(self, lvl: float) -> Components:
-        if self.include == "lower":
-            op = r"$\tt <$"
-        elif self.include == "upper":
-            op = r"$\tt \leq$"
-        else:
-            raise Exception(f"wrong value of include: '{self.include}'")
-        return self._format_open_core(lvl, op)
+        return self._format_open_core(lvl, self._op_open_left)
 
     def _format_open_right(self, lvl: float) -> Components:
-        if self.include == "lower":
-            op = r"$\tt \geq$"
-        elif self.include == "upper":
-            op = r"$\tt >$"
-        else:
-            raise Exception(f"wrong value of include: '{self.include}'")
-        return self._format_open_core(lvl, op)
+        return self._format_open_core(lvl, self._op_open_right)
 
     def _format_open_core(self, lvl: float, op: str, *, len_op: int = 1) -> Components:
-        lvl_fmtd = self._format_level(lvl)
+        lvl_fmtd = self._get_level_fmtd(lvl)
         ntex_c = len(op) - len_op
         s_c = op
         s_r = lvl_fmtd
         return Components.create("", (s_c, ntex_c), s_r)
 
+    def _format_levels(self, levels: Sequence[float]) -> Dict[Tuple[type, float], str]:
+        """Format levels once for all ranges they bound."""
+        # Key by type and value because, e.g., 1 and 1.0 may be formatted
+        # differently, and skip zero because 0.0 and -0.0 compare equal
+        return {(type(lvl), lvl): self._format_level(lvl) for lvl in levels if lvl}
+
+    def _get_level_fmtd(self, lvl: float) -> str:
+        """Return formatted level, precomputed by ``format_multiple`` if possible."""
+        try:
+            return self._levels_fmtd[(type(lvl), lvl)]
+        except KeyError:
+            return self._format_level(lvl)
+
     # pylint: disable=R0201  # no-self-use
     def _format_level(self, lvl: float) -> str:
         return format_float(lvl, "{f:.0E}")
@@ -448,6 +511,18 @@ class LevelRangeFormatterInt(LevelRangeFormatter):
             include=include,
         )
 
+        # Declare attributes
+        self._max_val_width: Optional[int] = None
+
+    def _set_max_val(self, max_val: float) -> None:
+        super()._set_max_val(max_val)
+        self._max_val_width = len(str(max_val))
+
+    def _format_levels(self, levels: Sequence[float]) -> Dict[Tuple[type, float], str]:
+        # Ranges are bounded by levels shifted by one, which are rarely among
+        # the levels, so precomputing would mostly format unused levels
+        return {}
+
     def _format_components(
         self, lvl0: Optional[float], lvl1: Optional[float]
     ) -> Components:
@@ -458,13 +533,13 @@ class LevelRangeFormatterInt(LevelRangeFormatter):
                 elif self.include == "upper":
                     lvl0 = lvl0 + 1
                 if lvl0 == lvl1:
-                    return Components.create("", "", self._format_level(lvl1))
+                    return Components.create("", "", self._get_level_fmtd(lvl1))
         return super()._format_components(lvl0, lvl1)
 
     def _format_level(self, lvl: float) -> str:
-        if int(lvl) != float(lvl):
+        if not isinstance(lvl, (int, np.integer)) and lvl != int(lvl):
             warnings.warn(f"{type(self).__name__}._format_level: not an int: {lvl}")
-        return f"{{:>{len(str(self._max_val))}}}".format(lvl)
+        return f"{{:>{self._max_val_width}}}".format(lvl)
 
     # def _format_open_left(self, lvl: float) -> Components:
     #     return self._format_open_core(lvl, r"$\tt\leq$")
@@ -497,9 +572,9 @@ class LevelRangeFormatterMath(LevelRangeFormatter):
         self, lvl0: Optional[float], lvl1: Optional[float]
     ) -> Components:
         return Components.create(
-            "-inf" if lvl0 is None else f"[{self._format_level(lvl0)}",
+            "-inf" if lvl0 is None else f"[{self._get_level_fmtd(lvl0)}",
             ",",
-            "inf" if lvl1 is None else f"{self._format_level(lvl1)})",
+            "inf" if lvl1 is None else f"{self._get_level_fmtd(lvl1)})",
         )
 
 
@@ -526,17 +601,20 @@ class LevelRangeFormatterUp(LevelRangeFormatter):
             include=include,
         )
 
-    def _format_closed(self, lvl0: float, lvl1: float) -> Components:
+        # Operator of closed ranges
+        self._op_closed: str
         if self.include == "lower":
-            op_fmtd = r"$\tt \geq$"
+            self._op_closed = r"$\tt \geq$"
         elif self.include == "upper":
-            op_fmtd = r"$\tt >$"
+            self._op_closed = r"$\tt >$"
         else:
             raise Exception(f"wrong value of include: '{self.include}'")
-        ntex_c = len(op_fmtd) - 1
-        s_c = op_fmtd
-        s_r = self._format_level(lvl0)
-        return Components.create("", (s_c, ntex_c), s_r)
+        self._ntex_c_closed: int = len(self._op_closed) - 1
+
+    def _format_closed(self, lvl0: float, lvl1: float) -> Components:
+        s_c = self._op_closed
+        s_r = self._get_level_fmtd(lvl0)
+        return Components.create("", (s_c, self._ntex_c_closed), s_r)
 
 
 class LevelRangeFormatterDown(LevelRangeFormatter):
@@ -562,17 +640,20 @@ class LevelRangeFormatterDown(LevelRangeFormatter):
             include=include,
         )
 
-    def _format_closed(self, lvl0: float, lvl1: float) -> Components:
+        # Operator of closed ranges
+        self._op_closed: str
         if self.include == "lower":
-            op_fmtd = r"$\tt <$"
+            self._op_closed = r"$\tt <$"
         elif self.include == "upper":
-            op_fmtd = r"$\tt \leq$"
+            self._op_closed = r"$\tt \leq$"
         else:
             raise Exception(f"wrong value of include: '{self.include}'")
-        ntex_c = len(op_fmtd) - 1
-        s_c = op_fmtd
-        s_r = self._format_level(lvl1)
-        return Components.create("", (s_c, ntex_c), s_r)
+        self._ntex_c_closed: int = len(self._op_closed) - 1
+
+    def _format_closed(self, lvl0: float, lvl1: float) -> Components:
+        s_c = self._op_closed
+        s_r = self._get_level_fmtd(lvl1)
+        return Components.create("", (s_c, self._ntex_c_closed), s_r)
 
 
 class LevelRangeFormatterAnd(LevelRangeFormatter):
@@ -598,54 +679,41 @@ class LevelRangeFormatterAnd(LevelRangeFormatter):
             include=include,
         )
 
-    def _format_closed(self, lvl0: float, lvl1: float) -> Components:
-
+        # Operators of closed ranges
+        self._op0_closed: str
+        self._op1_closed: str
         if self.include == "lower":
-            op0_fmtd = r"$\tt \geq$"
-            op1_fmtd = r"$\tt <$ "
+            self._op0_closed = r"$\tt \geq$"
+            self._op1_closed = r"$\tt <$ "
         elif self.include == "upper":
-            op0_fmtd = r"$\tt >$"
-            op1_fmtd = r"$\tt \leq$ "
+            self._op0_closed = r"$\tt >$"
+            self._op1_closed = r"$\tt \leq$ "
         else:
             raise Exception(f"wrong value of include: '{self.include}'")
+        self._op_closed: str = r"$\tt &$"
+        self._ntex_l_closed: int = len(self._op0_closed) - 1
+        self._ntex_c_closed: int = len(self._op_closed) - 1
+        self._ntex_r_closed: int = len(self._op1_closed) - 1
+        self._ntex_r_open_left: int = len(self._op_open_left) - 1
+        self._ntex_l_open_right: int = len(self._op_open_right) - 1
 
-        lvl0_fmtd = f"{op0_fmtd} {self._format_level(lvl0)}"
-        ntex_l = len(op0_fmtd) - 1
-
-        op_fmtd = r"$\tt &$"
-        ntex_c = len(op_fmtd) - 1
-
-        lvl1_fmtd = op1_fmtd + self._format_level(lvl1)
-        ntex_r = len(op1_fmtd) - 1
-
-        s_l = lvl0_fmtd
-        s_c = op_fmtd
-        s_r = lvl1_fmtd
-        return Components.create((s_l, ntex_l), (s_c, ntex_c), (s_r, ntex_r))
+    def _format_closed(self, lvl0: float, lvl1: float) -> Components:
+        s_l = f"{self._op0_closed} {self._get_level_fmtd(lvl0)}"
+        s_c = self._op_closed
+        s_r = self._op1_closed + self._get_level_fmtd(lvl1)
+        return Components.create(
+            (s_l, self._ntex_l_closed),
+            (s_c, self._ntex_c_closed),
+            (s_r, self._ntex_r_closed),
+        )
 
     def _format_open_left(self, lvl: float) -> Components:
-        if self.include == "lower":
-            op_fmtd = r"$\tt <$"
-        elif self.include == "upper":
-            op_fmtd = r"$\tt \leq$"
-        else:
-            raise Exception(f"wrong value of include: '{self.include}'")
-        lvl_fmtd = f"{op_fmtd} {self._format_level(lvl)}"
-        ntex_r = len(op_fmtd) - 1
-        s_r = lvl_fmtd
-        return Components.create("", "", (s_r, ntex_r))
+        s_r = f"{self._op_open_left} {self._get_level_fmtd(lvl)}"
+        return Components.create("", "", (s_r, self._ntex_r_open_left))
 
     def _format_open_right(self, lvl: float) -> Components:
-        if self.include == "lower":
-            op0_fmtd = r"$\tt \geq$"
-        elif self.include == "upper":
-            op0_fmtd = r"$\tt >$"
-        else:
-            raise Exception(f"wrong value of include: '{self.include}'")
-        lvl_fmtd = f"{op0_fmtd} {self._format_level(lvl)}"
-        ntex_l = len(op0_fmtd) - 1
-        s_l = lvl_fmtd
-        return Components.create((s_l, ntex_l), "", "")
+        s_l = f"{self._op_open_right} {self._get_level_fmtd(lvl)}"
+        return Components.create((s_l, self._ntex_l_open_right), "", "")
 
 
 class LevelRangeFormatterVar(LevelRangeFormatter):
@@ -675,7 +743,7 @@ class LevelRangeFormatterVar(LevelRangeFormatter):
             var = "v"
         self.var: str = var
 
-    def _format_closed(self, lvl0: float, lvl1: float) -> Components:
+        # Operator of closed ranges
         if self.include == "lower":
             op0 = r"$\tt \leq$"
             op1 = r"$\tt <$"
@@ -684,50 +752,41 @@ class LevelRangeFormatterVar(LevelRangeFormatter):
             op1 = r"$\tt \leq$"
         else:
             raise Exception(f"wrong value of include: '{self.include}'")
-        op_fmtd = f"{op0} {self.var} {op1}"
-        ntex_c = len(op0) + len(op1) - 2
-        s_l = self._format_level(lvl0)
-        s_c = op_fmtd
-        s_r = self._format_level(lvl1)
-        return Components.create(s_l, (s_c, ntex_c), s_r)
+        self._op_closed: str = f"{op0} {self.var} {op1}"
+        self._ntex_c_closed: int = len(op0) + len(op1) - 2
+
+        # Operators of ranges open to the left and right
+        self._op_open_left = f"  {self.var} {op1}"
+        self._ntex_c_open_left: int = len(op1) - 1
+        self._op_open_right = f"{op0} {self.var} "
+        self._ntex_c_open_right: int = len(op0) - 2
+
+    def _format_closed(self, lvl0: float, lvl1: float) -> Components:
+        s_l = self._get_level_fmtd(lvl0)
+        s_c = self._op_closed
+        s_r = self._get_level_fmtd(lvl1)
+        return Components.create(s_l, (s_c, self._ntex_c_closed), s_r)
 
     def _format_open_right(self, lvl: float) -> Components:
-        if self.include == "lower":
-            op0 = r"$\tt \leq$"
-        elif self.include == "upper":
-            op0 = r"$\tt <$"
-        else:
-            raise Exception(f"wrong value of include: '{self.include}'")
-        op1 = ""
-        op_fmtd = f"{op0} {self.var} {op1}"
-        ntex_c = len(op0) + len(op1) - 2
-        s_l = self._format_level(lvl)
-        s_c = op_fmtd
-        return Components.create(s_l, (s_c, ntex_c), "")
+        s_l = self._get_level_fmtd(lvl)
+        s_c = self._op_open_right
+        return Components.create(s_l, (s_c, self._ntex_c_open_right), "")
 
     def _format_open_left(self, lvl: float) -> Components:
-        op0 = " "
-        if self.include == "lower":
-            op1 = r"$\tt <$"
-        elif self.include == "upper":
-            op1 = r"$\tt \leq$"
-        else:
-            raise Exception(f"wrong value of include: '{self.include}'")
-        op_fmtd = f"{op0} {self.var} {op1}"
-        ntex_c = len(op0) + len(op1) - 2
-        s_c = op_fmtd
-        s_r = self._format_level(lvl)
-        return Components.create("", (s_c, ntex_c), s_r)
+        s_c = self._op_open_left
+        s_r = self._get_level_fmtd(lvl)
+        return Components.create("", (s_c, self._ntex_c_open_left), s_r)
 
 
 def format_ens_file_path(in_file_path, ens_member_ids: Optional[Sequence[int]]) -> str:
     """Format ensemble file paths in condensed form, e.g., 'mem{00..21}.nc'."""
     if ens_member_ids is None:
         return in_file_path
-    pattern = r"(?P<start>.*)(?P<pattern>{ens_member(:(?P<fmt>[0-9]*d?))?})(?P<end>.*)"
-    match = re.match(pattern, in_file_path)
+    match = _RX_ENS_PATH.match(in_file_path)
     if not match:
-        raise Exception(f"file path did not match '{pattern}': {in_file_path}")
+        raise Exception(
+            f"file path did not match '{_RX_ENS_PATH.pattern}': {in_file_path}"
+        )
     s_ids = format_numbers_range(
         sorted(ens_member_ids), fmt=match.group("fmt"), join_range="..", join_others=","
     )
@@ -0,0 +1,10 @@
+"""Tests for function ``pyflexplot.utils.formatting.format_float``."""
+# First-party
+from pyflexplot.utils.formatting import format_float
+
+
+def test_signed_zero():
+    """Cached results for 0.0 must not be returned for -0.0 and vice versa."""
+    assert format_float(0.0, "{f:.0E}") == "0.000"
+    assert format_float(-0.0, "{f:.0E}") == "-0.000"
+    assert format_float(0.0, "{f:.0E}") == "0.000"
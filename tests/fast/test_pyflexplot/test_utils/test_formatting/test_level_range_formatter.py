@@ -18,6 +18,7 @@ from pyflexplot.utils.formatting import LevelRangeFormatterInt
 from pyflexplot.utils.formatting import LevelRangeFormatterMath
 from pyflexplot.utils.formatting import LevelRangeFormatterUp
 from pyflexplot.utils.formatting import LevelRangeFormatterVar
+from pyflexplot.utils.formatting import format_level_ranges
 
 
 @dc.dataclass
@@ -148,3 +149,29 @@ def test_base(config):
     formatter = config.cls(**config.kwargs)
     res = formatter.format_multiple(levels)
     assert res == config.sol
+
+
+@pytest.mark.parametrize(
+    "levels, sol",
+    [
+        ([1, 2.0, 4], ["     1.0", "2.0 $\\tt -$  3"]),  # [levels0]
+        ([1.0, 2, 3], ["      1", "      2"]),  # [levels1]
+    ],
+)
+def test_int_mixed_types(levels, sol):
+    """Levels that compare equal are formatted according to their own type."""
+    formatter = LevelRangeFormatterInt()
+    res = formatter.format_multiple(levels)
+    assert res == sol
+
+
+def test_signed_zero():
+    """Levels 0.0 and -0.0 compare equal but are formatted differently."""
+    formatter = LevelRangeFormatter()
+    res = formatter.format_multiple([0.0, -0.0, 1.0])
+    assert res == ["0.000 $\\tt -$ -0.000", "-0.000 $\\tt -$ 1.000"]
+
+
+def test_unknown_style():
+    with pytest.raises(ValueError, match="unknown style 'foo'"):
+        format_level_ranges([1, 2], style="foo")
@@ -828,22 +828,30 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": 0.5982710615140827,
-                    "p_lat": 1.3534426050488195,
+                    "element_type": "markers",
+                    "p_lon": [
+                        10.899995803833008,
+                        11.573047637939453,
+                        12.133305549621582,
+                    ],
+                    "p_lat": [
+                        48.350006103515625,
+                        48.13188934326172,
+                        47.850345611572266,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Augsburg",
-                    "xy": [10.899995888928458, 48.35000612293118],
+                    "xy": [10.899995803833008, 48.350006103515625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -852,23 +860,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Munich",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -877,23 +872,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.431579219823128,
-                    "p_lat": 0.8698382849058798,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Rosenheim",
-                    "xy": [12.133305622006219, 47.85034669910101],
+                    "xy": [12.133305549621582, 47.850345611572266],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -946,9 +928,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.15040877914951992], [0.012, 0.012]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[1.431579219823128], [0.8698382849058798]],
                             [
                                 [
                                     -1.799999713897705,
@@ -1607,9 +1586,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.15040877914951992], [0.012, 0.012]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[1.431579219823128], [0.8698382849058798]],
                             [
                                 [
                                     -1.799999713897705,
@@ -2212,9 +2188,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.15040877914951992], [0.012, 0.012]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[1.431579219823128], [0.8698382849058798]],
                             [
                                 [
                                     -1.799999713897705,
@@ -2898,9 +2871,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.15040877914951992], [0.012, 0.012]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[1.431579219823128], [0.8698382849058798]],
                             [
                                 [
                                     -1.799999713897705,
@@ -4287,9 +4257,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.15040877914951992], [0.012, 0.012]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[1.431579219823128], [0.8698382849058798]],
                             [
                                 [
                                     -1.799999713897705,
@@ -4864,9 +4831,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.15040877914951992], [0.012, 0.012]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[1.431579219823128], [0.8698382849058798]],
                             [
                                 [
                                     -1.799999713897705,
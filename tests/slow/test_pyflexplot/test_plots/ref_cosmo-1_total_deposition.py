@@ -842,22 +842,34 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -1.7299107051303582,
-                    "p_lat": -0.055350440059029296,
+                    "element_type": "markers",
+                    "p_lon": [
+                        7.466975688934326,
+                        14.514968872070312,
+                        11.573047637939453,
+                        9.516669273376465,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        46.916683197021484,
+                        46.0552864074707,
+                        48.13188934326172,
+                        47.133724212646484,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -866,23 +878,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 3.131891384131564,
-                    "p_lat": -0.8544610896175058,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -891,23 +890,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "München",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -916,23 +902,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -941,23 +914,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1021,11 +981,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.1674183813443073], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -1.799999713897705,
@@ -1665,11 +1620,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.1674183813443073], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -1.799999713897705,
@@ -2253,11 +2203,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.1674183813443073], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -1.799999713897705,
@@ -3415,11 +3360,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.1674183813443073], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -1.799999713897705,
@@ -4787,11 +4727,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.1674183813443073], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -1.799999713897705,
@@ -5347,11 +5282,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.1674183813443073], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -1.799999713897705,
@@ -828,22 +828,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -2.694723737646699,
-                    "p_lat": 0.29827658114037836,
+                    "element_type": "markers",
+                    "p_lon": [6.030008792877197, 7.149996757507324, 6.922998428344727],
+                    "p_lat": [47.22999572753906, 46.79999923706055, 46.999000549316406],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Besançon",
-                    "xy": [6.030008909742378, 47.229996967653335],
+                    "xy": [6.030008792877197, 47.22999572753906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -852,23 +852,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.9505419794994965,
-                    "p_lat": -0.16452008347912606,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Fribourg",
-                    "xy": [7.149996522339677, 46.80000008003458],
+                    "xy": [7.149996757507324, 46.79999923706055],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -877,23 +864,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -2.0980099426869145,
-                    "p_lat": 0.040201053679546586,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Neuchâtel",
-                    "xy": [6.922998615397546, 46.99899914474071],
+                    "xy": [6.922998428344727, 46.999000549316406],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -946,9 +920,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.21954458161865573], [0.012, 0.012]],
-                            [[-2.694723737646699], [0.29827658114037836]],
-                            [[-1.9505419794994965], [-0.16452008347912606]],
-                            [[-2.0980099426869145], [0.040201053679546586]],
                             [
                                 [
                                     -4.359999656677246,
@@ -1604,9 +1575,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.21954458161865573], [0.012, 0.012]],
-                            [[-2.694723737646699], [0.29827658114037836]],
-                            [[-1.9505419794994965], [-0.16452008347912606]],
-                            [[-2.0980099426869145], [0.040201053679546586]],
                             [
                                 [
                                     -4.359999656677246,
@@ -2206,9 +2174,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.21954458161865573], [0.012, 0.012]],
-                            [[-2.694723737646699], [0.29827658114037836]],
-                            [[-1.9505419794994965], [-0.16452008347912606]],
-                            [[-2.0980099426869145], [0.040201053679546586]],
                             [
                                 [
                                     -4.359999656677246,
@@ -2889,9 +2854,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.21954458161865573], [0.012, 0.012]],
-                            [[-2.694723737646699], [0.29827658114037836]],
-                            [[-1.9505419794994965], [-0.16452008347912606]],
-                            [[-2.0980099426869145], [0.040201053679546586]],
                             [
                                 [
                                     -4.359999656677246,
@@ -4275,9 +4237,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.21954458161865573], [0.012, 0.012]],
-                            [[-2.694723737646699], [0.29827658114037836]],
-                            [[-1.9505419794994965], [-0.16452008347912606]],
-                            [[-2.0980099426869145], [0.040201053679546586]],
                             [
                                 [
                                     -4.359999656677246,
@@ -4849,9 +4808,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.21954458161865573], [0.012, 0.012]],
-                            [[-2.694723737646699], [0.29827658114037836]],
-                            [[-1.9505419794994965], [-0.16452008347912606]],
-                            [[-2.0980099426869145], [0.040201053679546586]],
                             [
                                 [
                                     -4.359999656677246,
@@ -1854,22 +1854,50 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -1.7299107051303582,
-                    "p_lat": -0.055350440059029296,
+                    "element_type": "markers",
+                    "p_lon": [
+                        7.466975688934326,
+                        11.340021133422852,
+                        8.675015449523926,
+                        8.930038452148438,
+                        14.514968872070312,
+                        6.130002975463867,
+                        4.828084468841553,
+                        9.203063011169434,
+                        11.573047637939453,
+                        14.464034080505371,
+                        7.6680145263671875,
+                        9.516669273376465,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        46.916683197021484,
+                        44.500423431396484,
+                        50.0999755859375,
+                        44.40998840332031,
+                        46.0552864074707,
+                        49.61166000366211,
+                        45.77195358276367,
+                        45.471920013427734,
+                        48.13188934326172,
+                        50.08528137207031,
+                        45.07233428955078,
+                        47.133724212646484,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1878,23 +1906,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9566249694301319,
-                    "p_lat": -2.491396597813492,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bologna",
-                    "xy": [11.34002070989385, 44.50042197578034],
+                    "xy": [11.340021133422852, 44.500423431396484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1903,23 +1918,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.8511180228253685,
-                    "p_lat": 3.1071742544059417,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frankfurt am Main",
-                    "xy": [8.675015420169643, 50.09997682606331],
+                    "xy": [8.675015449523926, 50.0999755859375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1928,23 +1930,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.7650843666587421,
-                    "p_lat": -2.58478718275538,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Genua",
-                    "xy": [8.93003861352986, 44.40998821926962],
+                    "xy": [8.930038452148438, 44.40998840332031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1953,23 +1942,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 3.131891384131564,
-                    "p_lat": -0.8544610896175058,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1978,23 +1954,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -2.5092487048188388,
-                    "p_lat": 2.6736393884327865,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Luxemburg",
-                    "xy": [6.130002806227083, 49.611660379121076],
+                    "xy": [6.130002975463867, 49.61166000366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2003,23 +1966,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2028,23 +1978,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.55904790593499,
-                    "p_lat": -1.5252354757562883,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Mailand",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2053,23 +1990,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "München",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2078,23 +2002,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 2.86700848906535,
-                    "p_lat": 3.1669698525752867,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Prag",
-                    "xy": [14.464033917048539, 50.08528287347832],
+                    "xy": [14.464034080505371, 50.08528137207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2103,23 +2014,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.6475606914315977,
-                    "p_lat": -1.9031455542508342,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2128,23 +2026,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2153,23 +2038,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2557,22 +2429,50 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -1.7299107051303582,
-                    "p_lat": -0.055350440059029296,
+                    "element_type": "markers",
+                    "p_lon": [
+                        7.466975688934326,
+                        11.340021133422852,
+                        8.675015449523926,
+                        8.930038452148438,
+                        14.514968872070312,
+                        6.130002975463867,
+                        4.828084468841553,
+                        9.203063011169434,
+                        11.573047637939453,
+                        14.464034080505371,
+                        7.6680145263671875,
+                        9.516669273376465,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        46.916683197021484,
+                        44.500423431396484,
+                        50.0999755859375,
+                        44.40998840332031,
+                        46.0552864074707,
+                        49.61166000366211,
+                        45.77195358276367,
+                        45.471920013427734,
+                        48.13188934326172,
+                        50.08528137207031,
+                        45.07233428955078,
+                        47.133724212646484,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2581,23 +2481,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9566249694301319,
-                    "p_lat": -2.491396597813492,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bologna",
-                    "xy": [11.34002070989385, 44.50042197578034],
+                    "xy": [11.340021133422852, 44.500423431396484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2606,23 +2493,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.8511180228253685,
-                    "p_lat": 3.1071742544059417,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frankfurt am Main",
-                    "xy": [8.675015420169643, 50.09997682606331],
+                    "xy": [8.675015449523926, 50.0999755859375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2631,23 +2505,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.7650843666587421,
-                    "p_lat": -2.58478718275538,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Genua",
-                    "xy": [8.93003861352986, 44.40998821926962],
+                    "xy": [8.930038452148438, 44.40998840332031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2656,23 +2517,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 3.131891384131564,
-                    "p_lat": -0.8544610896175058,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2681,23 +2529,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -2.5092487048188388,
-                    "p_lat": 2.6736393884327865,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Luxemburg",
-                    "xy": [6.130002806227083, 49.611660379121076],
+                    "xy": [6.130002975463867, 49.61166000366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2706,23 +2541,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2731,23 +2553,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.55904790593499,
-                    "p_lat": -1.5252354757562883,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Mailand",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2756,23 +2565,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "München",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2781,23 +2577,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 2.86700848906535,
-                    "p_lat": 3.1669698525752867,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Prag",
-                    "xy": [14.464033917048539, 50.08528287347832],
+                    "xy": [14.464034080505371, 50.08528137207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2806,23 +2589,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.6475606914315977,
-                    "p_lat": -1.9031455542508342,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2831,23 +2601,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2856,23 +2613,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3260,22 +3004,50 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -1.7299107051303582,
-                    "p_lat": -0.055350440059029296,
+                    "element_type": "markers",
+                    "p_lon": [
+                        7.466975688934326,
+                        11.340021133422852,
+                        8.675015449523926,
+                        8.930038452148438,
+                        14.514968872070312,
+                        6.130002975463867,
+                        4.828084468841553,
+                        9.203063011169434,
+                        11.573047637939453,
+                        14.464034080505371,
+                        7.6680145263671875,
+                        9.516669273376465,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        46.916683197021484,
+                        44.500423431396484,
+                        50.0999755859375,
+                        44.40998840332031,
+                        46.0552864074707,
+                        49.61166000366211,
+                        45.77195358276367,
+                        45.471920013427734,
+                        48.13188934326172,
+                        50.08528137207031,
+                        45.07233428955078,
+                        47.133724212646484,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3284,23 +3056,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9566249694301319,
-                    "p_lat": -2.491396597813492,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bologna",
-                    "xy": [11.34002070989385, 44.50042197578034],
+                    "xy": [11.340021133422852, 44.500423431396484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3309,23 +3068,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.8511180228253685,
-                    "p_lat": 3.1071742544059417,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frankfurt am Main",
-                    "xy": [8.675015420169643, 50.09997682606331],
+                    "xy": [8.675015449523926, 50.0999755859375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3334,23 +3080,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.7650843666587421,
-                    "p_lat": -2.58478718275538,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Genua",
-                    "xy": [8.93003861352986, 44.40998821926962],
+                    "xy": [8.930038452148438, 44.40998840332031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3359,23 +3092,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 3.131891384131564,
-                    "p_lat": -0.8544610896175058,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3384,23 +3104,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -2.5092487048188388,
-                    "p_lat": 2.6736393884327865,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Luxemburg",
-                    "xy": [6.130002806227083, 49.611660379121076],
+                    "xy": [6.130002975463867, 49.61166000366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3409,23 +3116,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3434,23 +3128,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.55904790593499,
-                    "p_lat": -1.5252354757562883,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Mailand",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3459,23 +3140,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "München",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3484,23 +3152,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 2.86700848906535,
-                    "p_lat": 3.1669698525752867,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Prag",
-                    "xy": [14.464033917048539, 50.08528287347832],
+                    "xy": [14.464034080505371, 50.08528137207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3509,23 +3164,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.6475606914315977,
-                    "p_lat": -1.9031455542508342,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3534,23 +3176,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3559,23 +3188,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3963,22 +3579,50 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -1.7299107051303582,
-                    "p_lat": -0.055350440059029296,
+                    "element_type": "markers",
+                    "p_lon": [
+                        7.466975688934326,
+                        11.340021133422852,
+                        8.675015449523926,
+                        8.930038452148438,
+                        14.514968872070312,
+                        6.130002975463867,
+                        4.828084468841553,
+                        9.203063011169434,
+                        11.573047637939453,
+                        14.464034080505371,
+                        7.6680145263671875,
+                        9.516669273376465,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        46.916683197021484,
+                        44.500423431396484,
+                        50.0999755859375,
+                        44.40998840332031,
+                        46.0552864074707,
+                        49.61166000366211,
+                        45.77195358276367,
+                        45.471920013427734,
+                        48.13188934326172,
+                        50.08528137207031,
+                        45.07233428955078,
+                        47.133724212646484,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3987,23 +3631,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9566249694301319,
-                    "p_lat": -2.491396597813492,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bologna",
-                    "xy": [11.34002070989385, 44.50042197578034],
+                    "xy": [11.340021133422852, 44.500423431396484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4012,23 +3643,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.8511180228253685,
-                    "p_lat": 3.1071742544059417,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frankfurt am Main",
-                    "xy": [8.675015420169643, 50.09997682606331],
+                    "xy": [8.675015449523926, 50.0999755859375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4037,23 +3655,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.7650843666587421,
-                    "p_lat": -2.58478718275538,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Genua",
-                    "xy": [8.93003861352986, 44.40998821926962],
+                    "xy": [8.930038452148438, 44.40998840332031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4062,23 +3667,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 3.131891384131564,
-                    "p_lat": -0.8544610896175058,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4087,23 +3679,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -2.5092487048188388,
-                    "p_lat": 2.6736393884327865,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Luxemburg",
-                    "xy": [6.130002806227083, 49.611660379121076],
+                    "xy": [6.130002975463867, 49.61166000366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4112,23 +3691,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4137,23 +3703,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.55904790593499,
-                    "p_lat": -1.5252354757562883,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Mailand",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4162,23 +3715,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "München",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4187,23 +3727,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 2.86700848906535,
-                    "p_lat": 3.1669698525752867,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Prag",
-                    "xy": [14.464033917048539, 50.08528287347832],
+                    "xy": [14.464034080505371, 50.08528137207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4212,23 +3739,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.6475606914315977,
-                    "p_lat": -1.9031455542508342,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4237,23 +3751,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4262,23 +3763,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4347,19 +3835,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -4493,19 +3968,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -4634,19 +4096,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -4770,19 +4219,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5410,19 +4846,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5556,19 +4979,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5697,19 +5107,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5833,19 +5230,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -6445,19 +5829,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -6591,19 +5962,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -6732,19 +6090,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -6868,19 +6213,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -7999,19 +7331,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -8145,19 +7464,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -8286,19 +7592,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -8422,19 +7715,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -9818,19 +9098,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -9964,19 +9231,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -10105,19 +9359,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -10241,19 +9482,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -10825,19 +10053,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -10971,19 +10186,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -11112,19 +10314,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -11248,19 +10437,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.13171742112482857], [0.018, 0.018]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -1899,22 +1899,58 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -0.39532400796620715,
-                    "p_lat": 0.33477580514118704,
+                    "element_type": "markers",
+                    "p_lon": [
+                        9.41670036315918,
+                        10.899995803833008,
+                        9.766701698303223,
+                        9.500029563903809,
+                        9.108000755310059,
+                        9.066699981689453,
+                        9.283302307128906,
+                        11.409990310668945,
+                        11.573047637939453,
+                        8.6329984664917,
+                        8.648001670837402,
+                        9.361998558044434,
+                        8.383302688598633,
+                        9.999999046325684,
+                        9.516669273376465,
+                        8.487000465393066,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        47.33330535888672,
+                        48.350006103515625,
+                        47.51669692993164,
+                        46.85002136230469,
+                        47.567996978759766,
+                        47.05000305175781,
+                        47.38330078125,
+                        47.2804069519043,
+                        48.13188934326172,
+                        47.70600128173828,
+                        47.019996643066406,
+                        47.422996520996094,
+                        46.95000457763672,
+                        48.400390625,
+                        47.133724212646484,
+                        47.17900085449219,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Appenzell",
-                    "xy": [9.41670050466189, 47.33330410307747],
+                    "xy": [9.41670036315918, 47.33330535888672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1923,23 +1959,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.5982710615140827,
-                    "p_lat": 1.3534426050488195,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Augsburg",
-                    "xy": [10.899995888928458, 48.35000612293118],
+                    "xy": [10.899995803833008, 48.350006103515625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1948,23 +1971,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.15757016641727162,
-                    "p_lat": 0.516931683455845,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bregenz",
-                    "xy": [9.766701588074284, 47.51669706581856],
+                    "xy": [9.766701698303223, 47.51669692993164],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1973,23 +1983,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.3419337805259432,
-                    "p_lat": -0.14888874723826762,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Chur",
-                    "xy": [9.500029661709334, 46.85002016101117],
+                    "xy": [9.500029563903809, 46.85002136230469],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1998,23 +1995,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.6018619068781201,
-                    "p_lat": 0.5714235569526547,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frauenfeld",
-                    "xy": [9.108000501947004, 47.56799716565638],
+                    "xy": [9.108000755310059, 47.567996978759766],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2023,23 +2007,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.6358986410112925,
-                    "p_lat": 0.053789816957011155,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Glarus",
-                    "xy": [9.066699586732966, 47.050002035926695],
+                    "xy": [9.066699981689453, 47.05000305175781],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2048,23 +2019,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.48527322190906813,
-                    "p_lat": 0.38551874965653454,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Herisau",
-                    "xy": [9.283302472138416, 47.38329903329509],
+                    "xy": [9.283302307128906, 47.38330078125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2073,23 +2031,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9565130989678482,
-                    "p_lat": 0.28901495668745003,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Innsbruck",
-                    "xy": [11.409990599216883, 47.28040732735394],
+                    "xy": [11.409990310668945, 47.2804069519043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2098,23 +2043,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Munich",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2123,23 +2055,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9199268437514138,
-                    "p_lat": 0.7140290818167164,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Schaffhausen",
-                    "xy": [8.632998523330116, 47.70600309067038],
+                    "xy": [8.6329984664917, 47.70600128173828],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2148,23 +2067,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9216698734209973,
-                    "p_lat": 0.02794898435258499,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Schwyz",
-                    "xy": [8.648001602841134, 47.0199960423883],
+                    "xy": [8.648001670837402, 47.019996643066406],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2173,23 +2079,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.4316663291944671,
-                    "p_lat": 0.4247557676906512,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "St. Gallen",
-                    "xy": [9.361998557241634, 47.42299806668797],
+                    "xy": [9.361998558044434, 47.422996520996094],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2198,23 +2091,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.1035383847408522,
-                    "p_lat": -0.038610353221614616,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Stans",
-                    "xy": [8.383302546723826, 46.95000307389006],
+                    "xy": [8.383302688598633, 46.95000457763672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2223,23 +2103,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -5.683977830844879e-07,
-                    "p_lat": 1.4003906444159628,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ulm",
-                    "xy": [9.999999144133199, 48.40039064441578],
+                    "xy": [9.999999046325684, 48.400390625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2248,23 +2115,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2273,23 +2127,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.0283424267836994,
-                    "p_lat": 0.18892911985237126,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zug",
-                    "xy": [8.487000564994787, 47.178999030533475],
+                    "xy": [8.487000465393066, 47.17900085449219],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2298,23 +2139,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2702,22 +2530,58 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -0.39532400796620715,
-                    "p_lat": 0.33477580514118704,
+                    "element_type": "markers",
+                    "p_lon": [
+                        9.41670036315918,
+                        10.899995803833008,
+                        9.766701698303223,
+                        9.500029563903809,
+                        9.108000755310059,
+                        9.066699981689453,
+                        9.283302307128906,
+                        11.409990310668945,
+                        11.573047637939453,
+                        8.6329984664917,
+                        8.648001670837402,
+                        9.361998558044434,
+                        8.383302688598633,
+                        9.999999046325684,
+                        9.516669273376465,
+                        8.487000465393066,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        47.33330535888672,
+                        48.350006103515625,
+                        47.51669692993164,
+                        46.85002136230469,
+                        47.567996978759766,
+                        47.05000305175781,
+                        47.38330078125,
+                        47.2804069519043,
+                        48.13188934326172,
+                        47.70600128173828,
+                        47.019996643066406,
+                        47.422996520996094,
+                        46.95000457763672,
+                        48.400390625,
+                        47.133724212646484,
+                        47.17900085449219,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Appenzell",
-                    "xy": [9.41670050466189, 47.33330410307747],
+                    "xy": [9.41670036315918, 47.33330535888672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2726,23 +2590,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.5982710615140827,
-                    "p_lat": 1.3534426050488195,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Augsburg",
-                    "xy": [10.899995888928458, 48.35000612293118],
+                    "xy": [10.899995803833008, 48.350006103515625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2751,23 +2602,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.15757016641727162,
-                    "p_lat": 0.516931683455845,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bregenz",
-                    "xy": [9.766701588074284, 47.51669706581856],
+                    "xy": [9.766701698303223, 47.51669692993164],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2776,23 +2614,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.3419337805259432,
-                    "p_lat": -0.14888874723826762,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Chur",
-                    "xy": [9.500029661709334, 46.85002016101117],
+                    "xy": [9.500029563903809, 46.85002136230469],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2801,23 +2626,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.6018619068781201,
-                    "p_lat": 0.5714235569526547,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frauenfeld",
-                    "xy": [9.108000501947004, 47.56799716565638],
+                    "xy": [9.108000755310059, 47.567996978759766],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2826,23 +2638,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.6358986410112925,
-                    "p_lat": 0.053789816957011155,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Glarus",
-                    "xy": [9.066699586732966, 47.050002035926695],
+                    "xy": [9.066699981689453, 47.05000305175781],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2851,23 +2650,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.48527322190906813,
-                    "p_lat": 0.38551874965653454,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Herisau",
-                    "xy": [9.283302472138416, 47.38329903329509],
+                    "xy": [9.283302307128906, 47.38330078125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2876,23 +2662,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9565130989678482,
-                    "p_lat": 0.28901495668745003,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Innsbruck",
-                    "xy": [11.409990599216883, 47.28040732735394],
+                    "xy": [11.409990310668945, 47.2804069519043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2901,23 +2674,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Munich",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2926,23 +2686,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9199268437514138,
-                    "p_lat": 0.7140290818167164,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Schaffhausen",
-                    "xy": [8.632998523330116, 47.70600309067038],
+                    "xy": [8.6329984664917, 47.70600128173828],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2951,23 +2698,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9216698734209973,
-                    "p_lat": 0.02794898435258499,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Schwyz",
-                    "xy": [8.648001602841134, 47.0199960423883],
+                    "xy": [8.648001670837402, 47.019996643066406],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2976,23 +2710,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.4316663291944671,
-                    "p_lat": 0.4247557676906512,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "St. Gallen",
-                    "xy": [9.361998557241634, 47.42299806668797],
+                    "xy": [9.361998558044434, 47.422996520996094],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3001,23 +2722,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.1035383847408522,
-                    "p_lat": -0.038610353221614616,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Stans",
-                    "xy": [8.383302546723826, 46.95000307389006],
+                    "xy": [8.383302688598633, 46.95000457763672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3026,23 +2734,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -5.683977830844879e-07,
-                    "p_lat": 1.4003906444159628,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ulm",
-                    "xy": [9.999999144133199, 48.40039064441578],
+                    "xy": [9.999999046325684, 48.400390625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3051,23 +2746,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3076,23 +2758,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.0283424267836994,
-                    "p_lat": 0.18892911985237126,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zug",
-                    "xy": [8.487000564994787, 47.178999030533475],
+                    "xy": [8.487000465393066, 47.17900085449219],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3101,23 +2770,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3505,22 +3161,58 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -0.39532400796620715,
-                    "p_lat": 0.33477580514118704,
+                    "element_type": "markers",
+                    "p_lon": [
+                        9.41670036315918,
+                        10.899995803833008,
+                        9.766701698303223,
+                        9.500029563903809,
+                        9.108000755310059,
+                        9.066699981689453,
+                        9.283302307128906,
+                        11.409990310668945,
+                        11.573047637939453,
+                        8.6329984664917,
+                        8.648001670837402,
+                        9.361998558044434,
+                        8.383302688598633,
+                        9.999999046325684,
+                        9.516669273376465,
+                        8.487000465393066,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        47.33330535888672,
+                        48.350006103515625,
+                        47.51669692993164,
+                        46.85002136230469,
+                        47.567996978759766,
+                        47.05000305175781,
+                        47.38330078125,
+                        47.2804069519043,
+                        48.13188934326172,
+                        47.70600128173828,
+                        47.019996643066406,
+                        47.422996520996094,
+                        46.95000457763672,
+                        48.400390625,
+                        47.133724212646484,
+                        47.17900085449219,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Appenzell",
-                    "xy": [9.41670050466189, 47.33330410307747],
+                    "xy": [9.41670036315918, 47.33330535888672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3529,23 +3221,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.5982710615140827,
-                    "p_lat": 1.3534426050488195,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Augsburg",
-                    "xy": [10.899995888928458, 48.35000612293118],
+                    "xy": [10.899995803833008, 48.350006103515625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3554,23 +3233,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.15757016641727162,
-                    "p_lat": 0.516931683455845,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bregenz",
-                    "xy": [9.766701588074284, 47.51669706581856],
+                    "xy": [9.766701698303223, 47.51669692993164],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3579,23 +3245,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.3419337805259432,
-                    "p_lat": -0.14888874723826762,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Chur",
-                    "xy": [9.500029661709334, 46.85002016101117],
+                    "xy": [9.500029563903809, 46.85002136230469],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3604,23 +3257,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.6018619068781201,
-                    "p_lat": 0.5714235569526547,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frauenfeld",
-                    "xy": [9.108000501947004, 47.56799716565638],
+                    "xy": [9.108000755310059, 47.567996978759766],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3629,23 +3269,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.6358986410112925,
-                    "p_lat": 0.053789816957011155,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Glarus",
-                    "xy": [9.066699586732966, 47.050002035926695],
+                    "xy": [9.066699981689453, 47.05000305175781],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3654,23 +3281,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.48527322190906813,
-                    "p_lat": 0.38551874965653454,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Herisau",
-                    "xy": [9.283302472138416, 47.38329903329509],
+                    "xy": [9.283302307128906, 47.38330078125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3679,23 +3293,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9565130989678482,
-                    "p_lat": 0.28901495668745003,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Innsbruck",
-                    "xy": [11.409990599216883, 47.28040732735394],
+                    "xy": [11.409990310668945, 47.2804069519043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3704,23 +3305,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Munich",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3729,23 +3317,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9199268437514138,
-                    "p_lat": 0.7140290818167164,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Schaffhausen",
-                    "xy": [8.632998523330116, 47.70600309067038],
+                    "xy": [8.6329984664917, 47.70600128173828],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3754,23 +3329,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9216698734209973,
-                    "p_lat": 0.02794898435258499,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Schwyz",
-                    "xy": [8.648001602841134, 47.0199960423883],
+                    "xy": [8.648001670837402, 47.019996643066406],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3779,23 +3341,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.4316663291944671,
-                    "p_lat": 0.4247557676906512,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "St. Gallen",
-                    "xy": [9.361998557241634, 47.42299806668797],
+                    "xy": [9.361998558044434, 47.422996520996094],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3804,23 +3353,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.1035383847408522,
-                    "p_lat": -0.038610353221614616,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Stans",
-                    "xy": [8.383302546723826, 46.95000307389006],
+                    "xy": [8.383302688598633, 46.95000457763672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3829,23 +3365,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -5.683977830844879e-07,
-                    "p_lat": 1.4003906444159628,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ulm",
-                    "xy": [9.999999144133199, 48.40039064441578],
+                    "xy": [9.999999046325684, 48.400390625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3854,23 +3377,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3879,23 +3389,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.0283424267836994,
-                    "p_lat": 0.18892911985237126,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zug",
-                    "xy": [8.487000564994787, 47.178999030533475],
+                    "xy": [8.487000465393066, 47.17900085449219],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3904,23 +3401,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4308,22 +3792,58 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -0.39532400796620715,
-                    "p_lat": 0.33477580514118704,
+                    "element_type": "markers",
+                    "p_lon": [
+                        9.41670036315918,
+                        10.899995803833008,
+                        9.766701698303223,
+                        9.500029563903809,
+                        9.108000755310059,
+                        9.066699981689453,
+                        9.283302307128906,
+                        11.409990310668945,
+                        11.573047637939453,
+                        8.6329984664917,
+                        8.648001670837402,
+                        9.361998558044434,
+                        8.383302688598633,
+                        9.999999046325684,
+                        9.516669273376465,
+                        8.487000465393066,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        47.33330535888672,
+                        48.350006103515625,
+                        47.51669692993164,
+                        46.85002136230469,
+                        47.567996978759766,
+                        47.05000305175781,
+                        47.38330078125,
+                        47.2804069519043,
+                        48.13188934326172,
+                        47.70600128173828,
+                        47.019996643066406,
+                        47.422996520996094,
+                        46.95000457763672,
+                        48.400390625,
+                        47.133724212646484,
+                        47.17900085449219,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Appenzell",
-                    "xy": [9.41670050466189, 47.33330410307747],
+                    "xy": [9.41670036315918, 47.33330535888672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4332,23 +3852,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.5982710615140827,
-                    "p_lat": 1.3534426050488195,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Augsburg",
-                    "xy": [10.899995888928458, 48.35000612293118],
+                    "xy": [10.899995803833008, 48.350006103515625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4357,23 +3864,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.15757016641727162,
-                    "p_lat": 0.516931683455845,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bregenz",
-                    "xy": [9.766701588074284, 47.51669706581856],
+                    "xy": [9.766701698303223, 47.51669692993164],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4382,23 +3876,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.3419337805259432,
-                    "p_lat": -0.14888874723826762,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Chur",
-                    "xy": [9.500029661709334, 46.85002016101117],
+                    "xy": [9.500029563903809, 46.85002136230469],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4407,23 +3888,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.6018619068781201,
-                    "p_lat": 0.5714235569526547,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frauenfeld",
-                    "xy": [9.108000501947004, 47.56799716565638],
+                    "xy": [9.108000755310059, 47.567996978759766],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4432,23 +3900,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.6358986410112925,
-                    "p_lat": 0.053789816957011155,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Glarus",
-                    "xy": [9.066699586732966, 47.050002035926695],
+                    "xy": [9.066699981689453, 47.05000305175781],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4457,23 +3912,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.48527322190906813,
-                    "p_lat": 0.38551874965653454,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Herisau",
-                    "xy": [9.283302472138416, 47.38329903329509],
+                    "xy": [9.283302307128906, 47.38330078125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4482,23 +3924,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9565130989678482,
-                    "p_lat": 0.28901495668745003,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Innsbruck",
-                    "xy": [11.409990599216883, 47.28040732735394],
+                    "xy": [11.409990310668945, 47.2804069519043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4507,23 +3936,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Munich",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4532,23 +3948,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9199268437514138,
-                    "p_lat": 0.7140290818167164,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Schaffhausen",
-                    "xy": [8.632998523330116, 47.70600309067038],
+                    "xy": [8.6329984664917, 47.70600128173828],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4557,23 +3960,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9216698734209973,
-                    "p_lat": 0.02794898435258499,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Schwyz",
-                    "xy": [8.648001602841134, 47.0199960423883],
+                    "xy": [8.648001670837402, 47.019996643066406],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4582,23 +3972,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.4316663291944671,
-                    "p_lat": 0.4247557676906512,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "St. Gallen",
-                    "xy": [9.361998557241634, 47.42299806668797],
+                    "xy": [9.361998558044434, 47.422996520996094],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4607,23 +3984,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.1035383847408522,
-                    "p_lat": -0.038610353221614616,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Stans",
-                    "xy": [8.383302546723826, 46.95000307389006],
+                    "xy": [8.383302688598633, 46.95000457763672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4632,23 +3996,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -5.683977830844879e-07,
-                    "p_lat": 1.4003906444159628,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ulm",
-                    "xy": [9.999999144133199, 48.40039064441578],
+                    "xy": [9.999999046325684, 48.400390625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4657,23 +4008,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4682,23 +4020,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.0283424267836994,
-                    "p_lat": 0.18892911985237126,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zug",
-                    "xy": [8.487000564994787, 47.178999030533475],
+                    "xy": [8.487000465393066, 47.17900085449219],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4707,23 +4032,10 @@ plot_summary = {
                     "size": 6.75,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -4792,23 +4104,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -4963,23 +4258,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5129,23 +4407,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5290,23 +4551,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5955,23 +5199,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -6126,23 +5353,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -6292,23 +5502,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -6453,23 +5646,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -7090,23 +6266,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -7261,23 +6420,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -7427,23 +6569,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -7588,23 +6713,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -8799,23 +7907,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -8970,23 +8061,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -9136,23 +8210,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -9297,23 +8354,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -10718,23 +9758,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -10889,23 +9912,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -11055,23 +10061,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -11216,23 +10205,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -11825,23 +10797,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -11996,23 +10951,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -12162,23 +11100,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -12323,23 +11244,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.11923456790123457], [0.018, 0.018]],
-                            [[-0.39532400796620715], [0.33477580514118704]],
-                            [[0.5982710615140827], [1.3534426050488195]],
-                            [[-0.15757016641727162], [0.516931683455845]],
-                            [[-0.3419337805259432], [-0.14888874723826762]],
-                            [[-0.6018619068781201], [0.5714235569526547]],
-                            [[-0.6358986410112925], [0.053789816957011155]],
-                            [[-0.48527322190906813], [0.38551874965653454]],
-                            [[0.9565130989678482], [0.28901495668745003]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[-0.9199268437514138], [0.7140290818167164]],
-                            [[-0.9216698734209973], [0.02794898435258499]],
-                            [[-0.4316663291944671], [0.4247557676906512]],
-                            [[-1.1035383847408522], [-0.038610353221614616]],
-                            [[-5.683977830844879e-07], [1.4003906444159628]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-1.0283424267836994], [0.18892911985237126]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -844,22 +844,50 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -1.7299107051303582,
-                    "p_lat": -0.055350440059029296,
+                    "element_type": "markers",
+                    "p_lon": [
+                        7.466975688934326,
+                        11.340021133422852,
+                        8.675015449523926,
+                        8.930038452148438,
+                        14.514968872070312,
+                        6.130002975463867,
+                        4.828084468841553,
+                        9.203063011169434,
+                        11.573047637939453,
+                        14.464034080505371,
+                        7.6680145263671875,
+                        9.516669273376465,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        46.916683197021484,
+                        44.500423431396484,
+                        50.0999755859375,
+                        44.40998840332031,
+                        46.0552864074707,
+                        49.61166000366211,
+                        45.77195358276367,
+                        45.471920013427734,
+                        48.13188934326172,
+                        50.08528137207031,
+                        45.07233428955078,
+                        47.133724212646484,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -868,23 +896,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9566249694301319,
-                    "p_lat": -2.491396597813492,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bologna",
-                    "xy": [11.34002070989385, 44.50042197578034],
+                    "xy": [11.340021133422852, 44.500423431396484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -893,23 +908,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.8511180228253685,
-                    "p_lat": 3.1071742544059417,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frankfurt am Main",
-                    "xy": [8.675015420169643, 50.09997682606331],
+                    "xy": [8.675015449523926, 50.0999755859375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -918,23 +920,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.7650843666587421,
-                    "p_lat": -2.58478718275538,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Genua",
-                    "xy": [8.93003861352986, 44.40998821926962],
+                    "xy": [8.930038452148438, 44.40998840332031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -943,23 +932,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 3.131891384131564,
-                    "p_lat": -0.8544610896175058,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -968,23 +944,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -2.5092487048188388,
-                    "p_lat": 2.6736393884327865,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Luxemburg",
-                    "xy": [6.130002806227083, 49.611660379121076],
+                    "xy": [6.130002975463867, 49.61166000366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -993,23 +956,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1018,23 +968,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.55904790593499,
-                    "p_lat": -1.5252354757562883,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Mailand",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1043,23 +980,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.0500161934866483,
-                    "p_lat": 1.1424296970156749,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "München",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1068,23 +992,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 2.86700848906535,
-                    "p_lat": 3.1669698525752867,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Prag",
-                    "xy": [14.464033917048539, 50.08528287347832],
+                    "xy": [14.464034080505371, 50.08528137207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1093,23 +1004,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.6475606914315977,
-                    "p_lat": -1.9031455542508342,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1118,23 +1016,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.32880353693312137,
-                    "p_lat": 0.13473804930293093,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1143,23 +1028,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.9830832677656959,
-                    "p_lat": 0.3910435840218871,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1223,19 +1095,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.12571742112482853], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -1886,19 +1745,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.12571742112482853], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -2493,19 +2339,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.12571742112482853], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -3674,19 +3507,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.12571742112482853], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5065,19 +4885,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.12571742112482853], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -5644,19 +5451,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.12571742112482853], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[-0.8511180228253685], [3.1071742544059417]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[3.131891384131564], [-0.8544610896175058]],
-                            [[-2.5092487048188388], [2.6736393884327865]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.0500161934866483], [1.1424296970156749]],
-                            [[2.86700848906535], [3.1669698525752867]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
-                            [[-0.32880353693312137], [0.13473804930293093]],
-                            [[-0.9830832677656959], [0.3910435840218871]],
                             [
                                 [
                                     -3.859999895095825,
@@ -856,22 +856,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -1.7299107051303582,
-                    "p_lat": -0.055350440059029296,
+                    "element_type": "markers",
+                    "p_lon": [7.466975688934326, 4.828084468841553, 7.6680145263671875],
+                    "p_lat": [46.916683197021484, 45.77195358276367, 45.07233428955078],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -880,23 +880,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -905,23 +892,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.6475606914315977,
-                    "p_lat": -1.9031455542508342,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -974,9 +948,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.24862551440329222], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -5.259999752044678,
@@ -1629,9 +1600,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.24862551440329222], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -5.259999752044678,
@@ -2520,9 +2488,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.24862551440329222], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -5.259999752044678,
@@ -3640,9 +3605,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.24862551440329222], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -5.259999752044678,
@@ -5023,9 +4985,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.24862551440329222], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -5.259999752044678,
@@ -5594,9 +5553,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.24862551440329222], [0.012, 0.012]],
-                            [[-1.7299107051303582], [-0.055350440059029296]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -5.259999752044678,
@@ -856,22 +856,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
+                    "element_type": "markers",
+                    "p_lon": [4.828084468841553],
+                    "p_lat": [45.77195358276367],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -924,7 +924,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.219681755829904], [0.012, 0.012]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -1575,7 +1574,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.219681755829904], [0.012, 0.012]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -2462,7 +2460,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.219681755829904], [0.012, 0.012]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -3578,7 +3575,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.219681755829904], [0.012, 0.012]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -4957,7 +4953,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.219681755829904], [0.012, 0.012]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -5524,7 +5519,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.219681755829904], [0.012, 0.012]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
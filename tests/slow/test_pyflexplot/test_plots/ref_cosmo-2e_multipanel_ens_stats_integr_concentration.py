@@ -1882,22 +1882,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
+                    "element_type": "markers",
+                    "p_lon": [4.828084468841553],
+                    "p_lat": [45.77195358276367],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2289,22 +2289,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
+                    "element_type": "markers",
+                    "p_lon": [4.828084468841553],
+                    "p_lat": [45.77195358276367],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -2696,22 +2696,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
+                    "element_type": "markers",
+                    "p_lon": [4.828084468841553],
+                    "p_lat": [45.77195358276367],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3103,22 +3103,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -3.6056507401715994,
-                    "p_lat": -1.1090235647081972,
+                    "element_type": "markers",
+                    "p_lon": [4.828084468841553],
+                    "p_lat": [45.77195358276367],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 0.75,
-                    "markersize": 2.25,
+                    "s": 5.0625,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 0.75,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -3187,7 +3187,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -3319,7 +3318,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -3446,7 +3444,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -3568,7 +3565,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -4228,7 +4224,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -4360,7 +4355,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -4487,7 +4481,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -4609,7 +4602,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -5389,7 +5381,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -5521,7 +5512,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -5648,7 +5638,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -5770,7 +5759,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -6893,7 +6881,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -7025,7 +7012,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -7152,7 +7138,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -7274,7 +7259,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -8662,7 +8646,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -8794,7 +8777,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -8921,7 +8903,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -9043,7 +9024,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -9619,7 +9599,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -9751,7 +9730,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -9878,7 +9856,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
@@ -10000,7 +9977,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.018, 0.22568175582990402], [0.018, 0.018]],
-                            [[-3.6056507401715994], [-1.1090235647081972]],
                             [
                                 [
                                     -5.259999752044678,
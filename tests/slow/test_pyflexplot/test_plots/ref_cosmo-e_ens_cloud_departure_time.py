@@ -847,22 +847,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -0.23053857518597878,
-                    "p_lat": -1.2991140320143515,
+                    "element_type": "markers",
+                    "p_lon": [9.66999340057373, 10.990015983581543],
+                    "p_lat": [45.700401306152344, 45.440391540527344],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bergamo",
-                    "xy": [9.6699934475173, 45.70040041002994],
+                    "xy": [9.66999340057373, 45.700401306152344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -871,23 +871,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.694884255272346,
-                    "p_lat": -1.5552188947333445,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Verona",
-                    "xy": [10.99001623398101, 45.44039044095342],
+                    "xy": [10.990015983581543, 45.440391540527344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -940,8 +927,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -1609,8 +1594,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -2514,8 +2497,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -3593,8 +3574,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -4990,8 +4969,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -5575,8 +5552,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
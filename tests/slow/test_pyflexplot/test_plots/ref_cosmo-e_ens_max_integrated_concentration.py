@@ -843,22 +843,22 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": -0.23053857518597878,
-                    "p_lat": -1.2991140320143515,
+                    "element_type": "markers",
+                    "p_lon": [9.66999340057373, 10.990015983581543],
+                    "p_lat": [45.700401306152344, 45.440391540527344],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bergamo",
-                    "xy": [9.6699934475173, 45.70040041002994],
+                    "xy": [9.66999340057373, 45.700401306152344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -867,23 +867,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.694884255272346,
-                    "p_lat": -1.5552188947333445,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Verona",
-                    "xy": [10.99001623398101, 45.44039044095342],
+                    "xy": [10.990015983581543, 45.440391540527344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -947,8 +934,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -1620,8 +1605,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -2413,8 +2396,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -3549,8 +3530,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -4950,8 +4929,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -5539,8 +5516,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.16042249657064472], [0.012, 0.012]],
-                            [[-0.23053857518597878], [-1.2991140320143515]],
-                            [[0.694884255272346], [-1.5552188947333445]],
                             [
                                 [
                                     -2.4200000762939453,
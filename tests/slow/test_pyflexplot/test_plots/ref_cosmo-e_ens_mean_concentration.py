@@ -843,22 +843,36 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": 0.9566249694301319,
-                    "p_lat": -2.491396597813492,
+                    "element_type": "markers",
+                    "p_lon": [
+                        11.340021133422852,
+                        11.25,
+                        8.930038452148438,
+                        9.203063011169434,
+                        12.441770553588867,
+                        7.6680145263671875,
+                    ],
+                    "p_lat": [
+                        44.500423431396484,
+                        43.78000259399414,
+                        44.40998840332031,
+                        45.471920013427734,
+                        43.93609619140625,
+                        45.07233428955078,
+                    ],
                     "marker": "o",
-                    "transform": "RotatedPole instance",
+                    "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Bologna",
-                    "xy": [11.34002070989385, 44.50042197578034],
+                    "xy": [11.340021133422852, 44.500423431396484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -867,23 +881,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 0.9038889874870777,
-                    "p_lat": -3.2127880784311613,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Florence",
-                    "xy": [11.250000364841299, 43.780000833199324],
+                    "xy": [11.25, 43.78000259399414],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -892,23 +893,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.7650843666587421,
-                    "p_lat": -2.58478718275538,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Genoa",
-                    "xy": [8.93003861352986, 44.40998821926962],
+                    "xy": [8.930038452148438, 44.40998840332031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -917,23 +905,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.55904790593499,
-                    "p_lat": -1.5252354757562883,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Milan",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -942,23 +917,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.7605694427323764,
-                    "p_lat": -3.0364672234232115,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "San Marino",
-                    "xy": [12.441770157800141, 43.936095834768004],
+                    "xy": [12.441770553588867, 43.93609619140625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -967,23 +929,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.6475606914315977,
-                    "p_lat": -1.9031455542508342,
-                    "marker": "o",
-                    "transform": "RotatedPole instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1047,12 +996,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.19773388203017833], [0.012, 0.012]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[0.9038889874870777], [-3.2127880784311613]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.7605694427323764], [-3.0364672234232115]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -1692,12 +1635,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.19773388203017833], [0.012, 0.012]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[0.9038889874870777], [-3.2127880784311613]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.7605694427323764], [-3.0364672234232115]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -2457,12 +2394,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.19773388203017833], [0.012, 0.012]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[0.9038889874870777], [-3.2127880784311613]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.7605694427323764], [-3.0364672234232115]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -3565,12 +3496,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.19773388203017833], [0.012, 0.012]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[0.9038889874870777], [-3.2127880784311613]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.7605694427323764], [-3.0364672234232115]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -4938,12 +4863,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.19773388203017833], [0.012, 0.012]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[0.9038889874870777], [-3.2127880784311613]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.7605694427323764], [-3.0364672234232115]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -5499,12 +5418,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.19773388203017833], [0.012, 0.012]],
-                            [[0.9566249694301319], [-2.491396597813492]],
-                            [[0.9038889874870777], [-3.2127880784311613]],
-                            [[-0.7650843666587421], [-2.58478718275538]],
-                            [[-0.55904790593499], [-1.5252354757562883]],
-                            [[1.7605694427323764], [-3.0364672234232115]],
-                            [[-1.6475606914315977], [-1.9031455542508342]],
                             [
                                 [
                                     -2.4200000762939453,
@@ -836,22 +836,90 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": 4.914694317400972,
-                    "p_lat": 52.35191454666443,
+                    "element_type": "markers",
+                    "p_lon": [
+                        4.914694309234619,
+                        13.399602890014648,
+                        7.466975688934326,
+                        17.116981506347656,
+                        23.699989318847656,
+                        4.331370830535889,
+                        19.081375122070312,
+                        12.561539649963379,
+                        13.75000286102295,
+                        8.675015449523926,
+                        18.640039443969727,
+                        9.998053550720215,
+                        24.932180404663086,
+                        20.497343063354492,
+                        19.958065032958984,
+                        14.514968872070312,
+                        6.130002975463867,
+                        24.02999496459961,
+                        9.203063011169434,
+                        11.573047637939453,
+                        10.74803352355957,
+                        14.464034080505371,
+                        24.099966049194336,
+                        18.095388412475586,
+                        24.72804069519043,
+                        4.269961357116699,
+                        7.6680145263671875,
+                        9.516669273376465,
+                        16.36469268798828,
+                        25.316635131835938,
+                        20.99805450439453,
+                        15.999994277954102,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        52.35191345214844,
+                        52.523765563964844,
+                        46.916683197021484,
+                        48.15001678466797,
+                        52.09998321533203,
+                        50.835262298583984,
+                        47.501953125,
+                        55.680511474609375,
+                        51.04996871948242,
+                        50.0999755859375,
+                        54.3599739074707,
+                        53.551971435546875,
+                        60.17750930786133,
+                        54.70000457763672,
+                        50.06192398071289,
+                        46.0552864074707,
+                        49.61166000366211,
+                        49.83498001098633,
+                        45.471920013427734,
+                        48.13188934326172,
+                        59.918636322021484,
+                        50.08528137207031,
+                        56.95002365112305,
+                        59.35270690917969,
+                        59.433876037597656,
+                        52.08003616333008,
+                        45.07233428955078,
+                        47.133724212646484,
+                        48.201961517333984,
+                        54.68336486816406,
+                        52.25194549560547,
+                        45.80000686645508,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
                     "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Amsterdam",
-                    "xy": [4.914694317400972, 52.35191454666443],
+                    "xy": [4.914694309234619, 52.35191345214844],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -860,23 +928,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 13.399602764700546,
-                    "p_lat": 52.523764522251156,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Berlin",
-                    "xy": [13.399602764700546, 52.523764522251156],
+                    "xy": [13.399602890014648, 52.523765563964844],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -885,23 +940,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 7.466975462482424,
-                    "p_lat": 46.91668275866772,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -910,23 +952,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 17.11698075223461,
-                    "p_lat": 48.15001832996171,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bratislava",
-                    "xy": [17.11698075223461, 48.15001832996171],
+                    "xy": [17.116981506347656, 48.15001678466797],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -935,23 +964,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 23.699989785464027,
-                    "p_lat": 52.099983946839416,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Brest",
-                    "xy": [23.699989785464027, 52.099983946839416],
+                    "xy": [23.699989318847656, 52.09998321533203],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -960,23 +976,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 4.33137074969045,
-                    "p_lat": 50.83526293533032,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Brussels",
-                    "xy": [4.33137074969045, 50.83526293533032],
+                    "xy": [4.331370830535889, 50.835262298583984],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -985,23 +988,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 19.081374818759684,
-                    "p_lat": 47.50195218499135,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Budapest",
-                    "xy": [19.081374818759684, 47.50195218499135],
+                    "xy": [19.081375122070312, 47.501953125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1010,23 +1000,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 12.561539888703294,
-                    "p_lat": 55.68051004902594,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Copenhagen",
-                    "xy": [12.561539888703294, 55.68051004902594],
+                    "xy": [12.561539649963379, 55.680511474609375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1035,23 +1012,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 13.750002806257669,
-                    "p_lat": 51.04997051910084,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Dresden",
-                    "xy": [13.750002806257669, 51.04997051910084],
+                    "xy": [13.75000286102295, 51.04996871948242],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1060,23 +1024,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 8.675015420169643,
-                    "p_lat": 50.09997682606331,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frankfurt",
-                    "xy": [8.675015420169643, 50.09997682606331],
+                    "xy": [8.675015449523926, 50.0999755859375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1085,23 +1036,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 18.64004024117304,
-                    "p_lat": 54.359975198476036,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Gdańsk",
-                    "xy": [18.64004024117304, 54.359975198476036],
+                    "xy": [18.640039443969727, 54.3599739074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1110,23 +1048,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.998053285520314,
-                    "p_lat": 53.55197049556244,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Hamburg",
-                    "xy": [9.998053285520314, 53.55197049556244],
+                    "xy": [9.998053550720215, 53.551971435546875],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1135,23 +1060,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 24.93218048284558,
-                    "p_lat": 60.17750923256807,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Helsinki",
-                    "xy": [24.93218048284558, 60.17750923256807],
+                    "xy": [24.932180404663086, 60.17750930786133],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1160,23 +1072,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 20.49734289417512,
-                    "p_lat": 54.70000612295655,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kaliningrad",
-                    "xy": [20.49734289417512, 54.70000612295655],
+                    "xy": [20.497343063354492, 54.70000457763672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1185,23 +1084,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 19.958065492591288,
-                    "p_lat": 50.061925126082315,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kraków",
-                    "xy": [19.958065492591288, 50.061925126082315],
+                    "xy": [19.958065032958984, 50.06192398071289],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1210,23 +1096,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 14.51496903347413,
-                    "p_lat": 46.0552883087945,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1235,23 +1108,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 6.130002806227083,
-                    "p_lat": 49.611660379121076,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Luxembourg",
-                    "xy": [6.130002806227083, 49.611660379121076],
+                    "xy": [6.130002975463867, 49.61166000366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1260,23 +1120,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 24.029995482079983,
-                    "p_lat": 49.834980081270544,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lviv",
-                    "xy": [24.029995482079983, 49.834980081270544],
+                    "xy": [24.02999496459961, 49.83498001098633],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1285,23 +1132,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.203063051142124,
-                    "p_lat": 45.47192105705352,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Milan",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1310,23 +1144,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 11.573047588912061,
-                    "p_lat": 48.131887894629244,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Munich",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1335,23 +1156,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 10.748033347372314,
-                    "p_lat": 59.91863614500187,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Oslo",
-                    "xy": [10.748033347372314, 59.91863614500187],
+                    "xy": [10.74803352355957, 59.918636322021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1360,23 +1168,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 14.464033917048539,
-                    "p_lat": 50.08528287347832,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Prague",
-                    "xy": [14.464033917048539, 50.08528287347832],
+                    "xy": [14.464034080505371, 50.08528137207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1385,23 +1180,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 24.099965371403187,
-                    "p_lat": 56.95002382316096,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Riga",
-                    "xy": [24.099965371403187, 56.95002382316096],
+                    "xy": [24.099966049194336, 56.95002365112305],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1410,23 +1192,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 18.095388874180912,
-                    "p_lat": 59.35270581286585,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Stockholm",
-                    "xy": [18.095388874180912, 59.35270581286585],
+                    "xy": [18.095388412475586, 59.35270690917969],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1435,23 +1204,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 24.72804072947855,
-                    "p_lat": 59.43387737948592,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Tallinn",
-                    "xy": [24.72804072947855, 59.43387737948592],
+                    "xy": [24.72804069519043, 59.433876037597656],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1460,23 +1216,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 4.2699613023134475,
-                    "p_lat": 52.08003684397488,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "The Hague",
-                    "xy": [4.2699613023134475, 52.08003684397488],
+                    "xy": [4.269961357116699, 52.08003616333008],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1485,23 +1228,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 7.668014629912079,
-                    "p_lat": 45.072333044356526,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1510,23 +1240,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.516669472907267,
-                    "p_lat": 47.13372377429357,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1535,23 +1252,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 16.364693096743736,
-                    "p_lat": 48.20196113681686,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vienna",
-                    "xy": [16.364693096743736, 48.20196113681686],
+                    "xy": [16.36469268798828, 48.201961517333984],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1560,23 +1264,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 25.3166352932829,
-                    "p_lat": 54.68336631175862,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vilnius",
-                    "xy": [25.3166352932829, 54.68336631175862],
+                    "xy": [25.316635131835938, 54.68336486816406],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1585,23 +1276,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 20.998053692465305,
-                    "p_lat": 52.25194648839556,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Warsaw",
-                    "xy": [20.998053692465305, 52.25194648839556],
+                    "xy": [20.99805450439453, 52.25194549560547],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1610,23 +1288,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 15.999994668245677,
-                    "p_lat": 45.80000673327254,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zagreb",
-                    "xy": [15.999994668245677, 45.80000673327254],
+                    "xy": [15.999994277954102, 45.80000686645508],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1635,23 +1300,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 8.548064271842577,
-                    "p_lat": 47.381933670993476,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1704,39 +1356,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -2401,39 +2020,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -3042,39 +2628,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -3764,39 +3317,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -5189,39 +4709,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -5802,39 +5289,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
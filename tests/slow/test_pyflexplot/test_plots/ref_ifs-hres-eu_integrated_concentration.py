@@ -843,22 +843,90 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": 4.914694317400972,
-                    "p_lat": 52.35191454666443,
+                    "element_type": "markers",
+                    "p_lon": [
+                        4.914694309234619,
+                        13.399602890014648,
+                        7.466975688934326,
+                        17.116981506347656,
+                        23.699989318847656,
+                        4.331370830535889,
+                        19.081375122070312,
+                        12.561539649963379,
+                        13.75000286102295,
+                        8.675015449523926,
+                        18.640039443969727,
+                        9.998053550720215,
+                        24.932180404663086,
+                        20.497343063354492,
+                        19.958065032958984,
+                        14.514968872070312,
+                        6.130002975463867,
+                        24.02999496459961,
+                        9.203063011169434,
+                        11.573047637939453,
+                        10.74803352355957,
+                        14.464034080505371,
+                        24.099966049194336,
+                        18.095388412475586,
+                        24.72804069519043,
+                        4.269961357116699,
+                        7.6680145263671875,
+                        9.516669273376465,
+                        16.36469268798828,
+                        25.316635131835938,
+                        20.99805450439453,
+                        15.999994277954102,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        52.35191345214844,
+                        52.523765563964844,
+                        46.916683197021484,
+                        48.15001678466797,
+                        52.09998321533203,
+                        50.835262298583984,
+                        47.501953125,
+                        55.680511474609375,
+                        51.04996871948242,
+                        50.0999755859375,
+                        54.3599739074707,
+                        53.551971435546875,
+                        60.17750930786133,
+                        54.70000457763672,
+                        50.06192398071289,
+                        46.0552864074707,
+                        49.61166000366211,
+                        49.83498001098633,
+                        45.471920013427734,
+                        48.13188934326172,
+                        59.918636322021484,
+                        50.08528137207031,
+                        56.95002365112305,
+                        59.35270690917969,
+                        59.433876037597656,
+                        52.08003616333008,
+                        45.07233428955078,
+                        47.133724212646484,
+                        48.201961517333984,
+                        54.68336486816406,
+                        52.25194549560547,
+                        45.80000686645508,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
                     "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Amsterdam",
-                    "xy": [4.914694317400972, 52.35191454666443],
+                    "xy": [4.914694309234619, 52.35191345214844],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -867,23 +935,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 13.399602764700546,
-                    "p_lat": 52.523764522251156,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Berlin",
-                    "xy": [13.399602764700546, 52.523764522251156],
+                    "xy": [13.399602890014648, 52.523765563964844],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -892,23 +947,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 7.466975462482424,
-                    "p_lat": 46.91668275866772,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -917,23 +959,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 17.11698075223461,
-                    "p_lat": 48.15001832996171,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bratislava",
-                    "xy": [17.11698075223461, 48.15001832996171],
+                    "xy": [17.116981506347656, 48.15001678466797],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -942,23 +971,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 23.699989785464027,
-                    "p_lat": 52.099983946839416,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Brest",
-                    "xy": [23.699989785464027, 52.099983946839416],
+                    "xy": [23.699989318847656, 52.09998321533203],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -967,23 +983,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 4.33137074969045,
-                    "p_lat": 50.83526293533032,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Brussels",
-                    "xy": [4.33137074969045, 50.83526293533032],
+                    "xy": [4.331370830535889, 50.835262298583984],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -992,23 +995,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 19.081374818759684,
-                    "p_lat": 47.50195218499135,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Budapest",
-                    "xy": [19.081374818759684, 47.50195218499135],
+                    "xy": [19.081375122070312, 47.501953125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1017,23 +1007,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 12.561539888703294,
-                    "p_lat": 55.68051004902594,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Copenhagen",
-                    "xy": [12.561539888703294, 55.68051004902594],
+                    "xy": [12.561539649963379, 55.680511474609375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1042,23 +1019,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 13.750002806257669,
-                    "p_lat": 51.04997051910084,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Dresden",
-                    "xy": [13.750002806257669, 51.04997051910084],
+                    "xy": [13.75000286102295, 51.04996871948242],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1067,23 +1031,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 8.675015420169643,
-                    "p_lat": 50.09997682606331,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frankfurt",
-                    "xy": [8.675015420169643, 50.09997682606331],
+                    "xy": [8.675015449523926, 50.0999755859375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1092,23 +1043,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 18.64004024117304,
-                    "p_lat": 54.359975198476036,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Gdańsk",
-                    "xy": [18.64004024117304, 54.359975198476036],
+                    "xy": [18.640039443969727, 54.3599739074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1117,23 +1055,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.998053285520314,
-                    "p_lat": 53.55197049556244,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Hamburg",
-                    "xy": [9.998053285520314, 53.55197049556244],
+                    "xy": [9.998053550720215, 53.551971435546875],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1142,23 +1067,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 24.93218048284558,
-                    "p_lat": 60.17750923256807,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Helsinki",
-                    "xy": [24.93218048284558, 60.17750923256807],
+                    "xy": [24.932180404663086, 60.17750930786133],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1167,23 +1079,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 20.49734289417512,
-                    "p_lat": 54.70000612295655,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kaliningrad",
-                    "xy": [20.49734289417512, 54.70000612295655],
+                    "xy": [20.497343063354492, 54.70000457763672],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1192,23 +1091,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 19.958065492591288,
-                    "p_lat": 50.061925126082315,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kraków",
-                    "xy": [19.958065492591288, 50.061925126082315],
+                    "xy": [19.958065032958984, 50.06192398071289],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1217,23 +1103,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 14.51496903347413,
-                    "p_lat": 46.0552883087945,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1242,23 +1115,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 6.130002806227083,
-                    "p_lat": 49.611660379121076,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Luxembourg",
-                    "xy": [6.130002806227083, 49.611660379121076],
+                    "xy": [6.130002975463867, 49.61166000366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1267,23 +1127,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 24.029995482079983,
-                    "p_lat": 49.834980081270544,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lviv",
-                    "xy": [24.029995482079983, 49.834980081270544],
+                    "xy": [24.02999496459961, 49.83498001098633],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1292,23 +1139,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.203063051142124,
-                    "p_lat": 45.47192105705352,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Milan",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1317,23 +1151,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 11.573047588912061,
-                    "p_lat": 48.131887894629244,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Munich",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1342,23 +1163,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 10.748033347372314,
-                    "p_lat": 59.91863614500187,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Oslo",
-                    "xy": [10.748033347372314, 59.91863614500187],
+                    "xy": [10.74803352355957, 59.918636322021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1367,23 +1175,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 14.464033917048539,
-                    "p_lat": 50.08528287347832,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Prague",
-                    "xy": [14.464033917048539, 50.08528287347832],
+                    "xy": [14.464034080505371, 50.08528137207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1392,23 +1187,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 24.099965371403187,
-                    "p_lat": 56.95002382316096,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Riga",
-                    "xy": [24.099965371403187, 56.95002382316096],
+                    "xy": [24.099966049194336, 56.95002365112305],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1417,23 +1199,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 18.095388874180912,
-                    "p_lat": 59.35270581286585,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Stockholm",
-                    "xy": [18.095388874180912, 59.35270581286585],
+                    "xy": [18.095388412475586, 59.35270690917969],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1442,23 +1211,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 24.72804072947855,
-                    "p_lat": 59.43387737948592,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Tallinn",
-                    "xy": [24.72804072947855, 59.43387737948592],
+                    "xy": [24.72804069519043, 59.433876037597656],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1467,23 +1223,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 4.2699613023134475,
-                    "p_lat": 52.08003684397488,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "The Hague",
-                    "xy": [4.2699613023134475, 52.08003684397488],
+                    "xy": [4.269961357116699, 52.08003616333008],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1492,23 +1235,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 7.668014629912079,
-                    "p_lat": 45.072333044356526,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1517,23 +1247,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.516669472907267,
-                    "p_lat": 47.13372377429357,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1542,23 +1259,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 16.364693096743736,
-                    "p_lat": 48.20196113681686,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vienna",
-                    "xy": [16.364693096743736, 48.20196113681686],
+                    "xy": [16.36469268798828, 48.201961517333984],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1567,23 +1271,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 25.3166352932829,
-                    "p_lat": 54.68336631175862,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vilnius",
-                    "xy": [25.3166352932829, 54.68336631175862],
+                    "xy": [25.316635131835938, 54.68336486816406],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1592,23 +1283,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 20.998053692465305,
-                    "p_lat": 52.25194648839556,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Warsaw",
-                    "xy": [20.998053692465305, 52.25194648839556],
+                    "xy": [20.99805450439453, 52.25194549560547],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1617,23 +1295,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 15.999994668245677,
-                    "p_lat": 45.80000673327254,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zagreb",
-                    "xy": [15.999994668245677, 45.80000673327254],
+                    "xy": [15.999994277954102, 45.80000686645508],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1642,23 +1307,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 8.548064271842577,
-                    "p_lat": 47.381933670993476,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1722,39 +1374,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -2423,39 +2042,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -3068,39 +2654,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -4232,39 +3785,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -5661,39 +5181,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -6278,39 +5765,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.06933882030178327], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[23.699989785464027], [52.099983946839416]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[12.561539888703294], [55.68051004902594]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[24.93218048284558], [60.17750923256807]],
-                            [[20.49734289417512], [54.70000612295655]],
-                            [[19.958065492591288], [50.061925126082315]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[24.029995482079983], [49.834980081270544]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[10.748033347372314], [59.91863614500187]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[24.099965371403187], [56.95002382316096]],
-                            [[18.095388874180912], [59.35270581286585]],
-                            [[24.72804072947855], [59.43387737948592]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[25.3166352932829], [54.68336631175862]],
-                            [[20.998053692465305], [52.25194648839556]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
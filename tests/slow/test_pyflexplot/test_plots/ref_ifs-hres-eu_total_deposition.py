@@ -852,22 +852,106 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": 4.914694317400972,
-                    "p_lat": 52.35191454666443,
+                    "element_type": "markers",
+                    "p_lon": [
+                        4.914694309234619,
+                        1.5164859294891357,
+                        2.181424379348755,
+                        16.872758865356445,
+                        13.399602890014648,
+                        7.466975688934326,
+                        -1.9219425916671753,
+                        11.340021133422852,
+                        17.116981506347656,
+                        4.331370830535889,
+                        19.081375122070312,
+                        18.640039443969727,
+                        4.269961357116699,
+                        13.75000286102295,
+                        11.25,
+                        8.675015449523926,
+                        8.930038452148438,
+                        9.998053550720215,
+                        14.514968872070312,
+                        -0.11866769939661026,
+                        6.130002975463867,
+                        4.828084468841553,
+                        9.203063011169434,
+                        -2.2499330043792725,
+                        5.373064041137695,
+                        7.4069132804870605,
+                        11.573047637939453,
+                        14.24306583404541,
+                        2.3313894271850586,
+                        19.266307830810547,
+                        14.464034080505371,
+                        12.48131275177002,
+                        12.441770553588867,
+                        18.38300132751465,
+                        1.4479808807373047,
+                        7.6680145263671875,
+                        9.516669273376465,
+                        12.453386306762695,
+                        16.36469268798828,
+                        15.999994277954102,
+                        8.548064231872559,
+                    ],
+                    "p_lat": [
+                        52.35191345214844,
+                        42.5,
+                        41.38524627685547,
+                        41.114219665527344,
+                        52.523765563964844,
+                        46.916683197021484,
+                        52.47692108154297,
+                        44.500423431396484,
+                        48.15001678466797,
+                        50.835262298583984,
+                        47.501953125,
+                        54.3599739074707,
+                        52.08003616333008,
+                        51.04996871948242,
+                        43.78000259399414,
+                        50.0999755859375,
+                        44.40998840332031,
+                        53.551971435546875,
+                        46.0552864074707,
+                        51.5019416809082,
+                        49.61166000366211,
+                        45.77195358276367,
+                        45.471920013427734,
+                        53.50236129760742,
+                        43.29192352294922,
+                        43.739646911621094,
+                        48.13188934326172,
+                        40.84197235107422,
+                        48.86863708496094,
+                        42.465972900390625,
+                        50.08528137207031,
+                        41.89789962768555,
+                        43.93609619140625,
+                        43.85002136230469,
+                        43.62190628051758,
+                        45.07233428955078,
+                        47.133724212646484,
+                        41.903282165527344,
+                        48.201961517333984,
+                        45.80000686645508,
+                        47.381935119628906,
+                    ],
                     "marker": "o",
                     "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Amsterdam",
-                    "xy": [4.914694317400972, 52.35191454666443],
+                    "xy": [4.914694309234619, 52.35191345214844],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -876,23 +960,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.5164859605055199,
-                    "p_lat": 42.5000014435459,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Andorra la Vella",
-                    "xy": [1.5164859605055199, 42.5000014435459],
+                    "xy": [1.5164859294891357, 42.5],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -901,23 +972,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 2.181424460619155,
-                    "p_lat": 41.385245438547486,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Barcelona",
-                    "xy": [2.181424460619155, 41.385245438547486],
+                    "xy": [2.181424379348755, 41.38524627685547],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -926,23 +984,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 16.87275793322317,
-                    "p_lat": 41.114220396990845,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bari",
-                    "xy": [16.87275793322317, 41.114220396990845],
+                    "xy": [16.872758865356445, 41.114219665527344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -951,23 +996,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 13.399602764700546,
-                    "p_lat": 52.523764522251156,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Berlin",
-                    "xy": [13.399602764700546, 52.523764522251156],
+                    "xy": [13.399602890014648, 52.523765563964844],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -976,23 +1008,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 7.466975462482424,
-                    "p_lat": 46.91668275866772,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bern",
-                    "xy": [7.466975462482424, 46.91668275866772],
+                    "xy": [7.466975688934326, 46.916683197021484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1001,23 +1020,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -1.9219426455170492,
-                    "p_lat": 52.47691983637844,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Birmingham",
-                    "xy": [-1.9219426455170492, 52.47691983637844],
+                    "xy": [-1.9219425916671753, 52.47692108154297],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1026,23 +1032,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 11.34002070989385,
-                    "p_lat": 44.50042197578034,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bologna",
-                    "xy": [11.34002070989385, 44.50042197578034],
+                    "xy": [11.340021133422852, 44.500423431396484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1051,23 +1044,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 17.11698075223461,
-                    "p_lat": 48.15001832996171,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Bratislava",
-                    "xy": [17.11698075223461, 48.15001832996171],
+                    "xy": [17.116981506347656, 48.15001678466797],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1076,23 +1056,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 4.33137074969045,
-                    "p_lat": 50.83526293533032,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Brüssel",
-                    "xy": [4.33137074969045, 50.83526293533032],
+                    "xy": [4.331370830535889, 50.835262298583984],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1101,23 +1068,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 19.081374818759684,
-                    "p_lat": 47.50195218499135,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Budapest",
-                    "xy": [19.081374818759684, 47.50195218499135],
+                    "xy": [19.081375122070312, 47.501953125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1126,23 +1080,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 18.64004024117304,
-                    "p_lat": 54.359975198476036,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Danzig",
-                    "xy": [18.64004024117304, 54.359975198476036],
+                    "xy": [18.640039443969727, 54.3599739074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1151,23 +1092,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 4.2699613023134475,
-                    "p_lat": 52.08003684397488,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Den Haag",
-                    "xy": [4.2699613023134475, 52.08003684397488],
+                    "xy": [4.269961357116699, 52.08003616333008],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1176,23 +1104,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 13.750002806257669,
-                    "p_lat": 51.04997051910084,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Dresden",
-                    "xy": [13.750002806257669, 51.04997051910084],
+                    "xy": [13.75000286102295, 51.04996871948242],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1201,23 +1116,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 11.250000364841299,
-                    "p_lat": 43.780000833199324,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Florenz",
-                    "xy": [11.250000364841299, 43.780000833199324],
+                    "xy": [11.25, 43.78000259399414],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1226,23 +1128,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 8.675015420169643,
-                    "p_lat": 50.09997682606331,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Frankfurt am Main",
-                    "xy": [8.675015420169643, 50.09997682606331],
+                    "xy": [8.675015449523926, 50.0999755859375],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1251,23 +1140,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 8.93003861352986,
-                    "p_lat": 44.40998821926962,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Genua",
-                    "xy": [8.93003861352986, 44.40998821926962],
+                    "xy": [8.930038452148438, 44.40998840332031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1276,23 +1152,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.998053285520314,
-                    "p_lat": 53.55197049556244,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Hamburg",
-                    "xy": [9.998053285520314, 53.55197049556244],
+                    "xy": [9.998053550720215, 53.551971435546875],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1301,23 +1164,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 14.51496903347413,
-                    "p_lat": 46.0552883087945,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ljubljana",
-                    "xy": [14.51496903347413, 46.0552883087945],
+                    "xy": [14.514968872070312, 46.0552864074707],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1326,23 +1176,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -0.11866770247593195,
-                    "p_lat": 51.5019405883275,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "London",
-                    "xy": [-0.11866770247593195, 51.5019405883275],
+                    "xy": [-0.11866769939661026, 51.5019416809082],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1351,23 +1188,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 6.130002806227083,
-                    "p_lat": 49.611660379121076,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Luxemburg",
-                    "xy": [6.130002806227083, 49.611660379121076],
+                    "xy": [6.130002975463867, 49.61166000366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1376,23 +1200,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 4.828084616879835,
-                    "p_lat": 45.7719544229401,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lyon",
-                    "xy": [4.828084616879835, 45.7719544229401],
+                    "xy": [4.828084468841553, 45.77195358276367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1401,23 +1212,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.203063051142124,
-                    "p_lat": 45.47192105705352,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Mailand",
-                    "xy": [9.203063051142124, 45.47192105705352],
+                    "xy": [9.203063011169434, 45.471920013427734],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1426,23 +1224,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": -2.249932961273487,
-                    "p_lat": 53.502361120562284,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Manchester",
-                    "xy": [-2.249932961273487, 53.502361120562284],
+                    "xy": [-2.2499330043792725, 53.50236129760742],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1451,23 +1236,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 5.3730642718298895,
-                    "p_lat": 43.29192492260455,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Marseille",
-                    "xy": [5.3730642718298895, 43.29192492260455],
+                    "xy": [5.373064041137695, 43.29192352294922],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1476,23 +1248,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 7.406913173465057,
-                    "p_lat": 43.73964568785249,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Monaco",
-                    "xy": [7.406913173465057, 43.73964568785249],
+                    "xy": [7.4069132804870605, 43.739646911621094],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1501,23 +1260,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 11.573047588912061,
-                    "p_lat": 48.131887894629244,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "München",
-                    "xy": [11.573047588912061, 48.131887894629244],
+                    "xy": [11.573047637939453, 48.13188934326172],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1526,23 +1272,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 14.243065492568519,
-                    "p_lat": 40.841971105863195,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Neapel",
-                    "xy": [14.243065492568519, 40.841971105863195],
+                    "xy": [14.24306583404541, 40.84197235107422],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1551,23 +1284,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 2.33138946713035,
-                    "p_lat": 48.86863878981461,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Paris",
-                    "xy": [2.33138946713035, 48.86863878981461],
+                    "xy": [2.3313894271850586, 48.86863708496094],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1576,23 +1296,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 19.266306924118226,
-                    "p_lat": 42.465972512881706,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Podgorica",
-                    "xy": [19.266306924118226, 42.465972512881706],
+                    "xy": [19.266307830810547, 42.465972900390625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1601,23 +1308,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 14.464033917048539,
-                    "p_lat": 50.08528287347832,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Prag",
-                    "xy": [14.464033917048539, 50.08528287347832],
+                    "xy": [14.464034080505371, 50.08528137207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1626,23 +1320,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 12.481312562873995,
-                    "p_lat": 41.89790148509894,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Rom",
-                    "xy": [12.481312562873995, 41.89790148509894],
+                    "xy": [12.48131275177002, 41.89789962768555],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1651,23 +1332,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 12.441770157800141,
-                    "p_lat": 43.936095834768004,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "San Marino",
-                    "xy": [12.441770157800141, 43.936095834768004],
+                    "xy": [12.441770553588867, 43.93609619140625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1676,23 +1344,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 18.383001666953305,
-                    "p_lat": 43.850022398954934,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Sarajevo",
-                    "xy": [18.383001666953305, 43.850022398954934],
+                    "xy": [18.38300132751465, 43.85002136230469],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1701,23 +1356,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 1.4479808571006174,
-                    "p_lat": 43.621904781004275,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Toulouse",
-                    "xy": [1.4479808571006174, 43.621904781004275],
+                    "xy": [1.4479808807373047, 43.62190628051758],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1726,23 +1368,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 7.668014629912079,
-                    "p_lat": 45.072333044356526,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Turin",
-                    "xy": [7.668014629912079, 45.072333044356526],
+                    "xy": [7.6680145263671875, 45.07233428955078],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1751,23 +1380,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 9.516669472907267,
-                    "p_lat": 47.13372377429357,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vaduz",
-                    "xy": [9.516669472907267, 47.13372377429357],
+                    "xy": [9.516669273376465, 47.133724212646484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1776,23 +1392,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 12.453386544971766,
-                    "p_lat": 41.903282179960115,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vatikanstadt",
-                    "xy": [12.453386544971766, 41.903282179960115],
+                    "xy": [12.453386306762695, 41.903282165527344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1801,23 +1404,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 16.364693096743736,
-                    "p_lat": 48.20196113681686,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Wien",
-                    "xy": [16.364693096743736, 48.20196113681686],
+                    "xy": [16.36469268798828, 48.201961517333984],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1826,23 +1416,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 15.999994668245677,
-                    "p_lat": 45.80000673327254,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zagreb",
-                    "xy": [15.999994668245677, 45.80000673327254],
+                    "xy": [15.999994277954102, 45.80000686645508],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1851,23 +1428,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 8.548064271842577,
-                    "p_lat": 47.381933670993476,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zürich",
-                    "xy": [8.548064271842577, 47.381933670993476],
+                    "xy": [8.548064231872559, 47.381935119628906],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1931,47 +1495,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.0649035208047554], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[1.5164859605055199], [42.5000014435459]],
-                            [[2.181424460619155], [41.385245438547486]],
-                            [[16.87275793322317], [41.114220396990845]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[-1.9219426455170492], [52.47691983637844]],
-                            [[11.34002070989385], [44.50042197578034]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[11.250000364841299], [43.780000833199324]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[8.93003861352986], [44.40998821926962]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[-0.11866770247593195], [51.5019405883275]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[4.828084616879835], [45.7719544229401]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[-2.249932961273487], [53.502361120562284]],
-                            [[5.3730642718298895], [43.29192492260455]],
-                            [[7.406913173465057], [43.73964568785249]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[14.243065492568519], [40.841971105863195]],
-                            [[2.33138946713035], [48.86863878981461]],
-                            [[19.266306924118226], [42.465972512881706]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[12.481312562873995], [41.89790148509894]],
-                            [[12.441770157800141], [43.936095834768004]],
-                            [[18.383001666953305], [43.850022398954934]],
-                            [[1.4479808571006174], [43.621904781004275]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[12.453386544971766], [41.903282179960115]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -2640,47 +2163,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.0649035208047554], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[1.5164859605055199], [42.5000014435459]],
-                            [[2.181424460619155], [41.385245438547486]],
-                            [[16.87275793322317], [41.114220396990845]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[-1.9219426455170492], [52.47691983637844]],
-                            [[11.34002070989385], [44.50042197578034]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[11.250000364841299], [43.780000833199324]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[8.93003861352986], [44.40998821926962]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[-0.11866770247593195], [51.5019405883275]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[4.828084616879835], [45.7719544229401]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[-2.249932961273487], [53.502361120562284]],
-                            [[5.3730642718298895], [43.29192492260455]],
-                            [[7.406913173465057], [43.73964568785249]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[14.243065492568519], [40.841971105863195]],
-                            [[2.33138946713035], [48.86863878981461]],
-                            [[19.266306924118226], [42.465972512881706]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[12.481312562873995], [41.89790148509894]],
-                            [[12.441770157800141], [43.936095834768004]],
-                            [[18.383001666953305], [43.850022398954934]],
-                            [[1.4479808571006174], [43.621904781004275]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[12.453386544971766], [41.903282179960115]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -3293,47 +2775,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.0649035208047554], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[1.5164859605055199], [42.5000014435459]],
-                            [[2.181424460619155], [41.385245438547486]],
-                            [[16.87275793322317], [41.114220396990845]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[-1.9219426455170492], [52.47691983637844]],
-                            [[11.34002070989385], [44.50042197578034]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[11.250000364841299], [43.780000833199324]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[8.93003861352986], [44.40998821926962]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[-0.11866770247593195], [51.5019405883275]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[4.828084616879835], [45.7719544229401]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[-2.249932961273487], [53.502361120562284]],
-                            [[5.3730642718298895], [43.29192492260455]],
-                            [[7.406913173465057], [43.73964568785249]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[14.243065492568519], [40.841971105863195]],
-                            [[2.33138946713035], [48.86863878981461]],
-                            [[19.266306924118226], [42.465972512881706]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[12.481312562873995], [41.89790148509894]],
-                            [[12.441770157800141], [43.936095834768004]],
-                            [[18.383001666953305], [43.850022398954934]],
-                            [[1.4479808571006174], [43.621904781004275]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[12.453386544971766], [41.903282179960115]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -4520,47 +3961,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.0649035208047554], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[1.5164859605055199], [42.5000014435459]],
-                            [[2.181424460619155], [41.385245438547486]],
-                            [[16.87275793322317], [41.114220396990845]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[-1.9219426455170492], [52.47691983637844]],
-                            [[11.34002070989385], [44.50042197578034]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[11.250000364841299], [43.780000833199324]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[8.93003861352986], [44.40998821926962]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[-0.11866770247593195], [51.5019405883275]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[4.828084616879835], [45.7719544229401]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[-2.249932961273487], [53.502361120562284]],
-                            [[5.3730642718298895], [43.29192492260455]],
-                            [[7.406913173465057], [43.73964568785249]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[14.243065492568519], [40.841971105863195]],
-                            [[2.33138946713035], [48.86863878981461]],
-                            [[19.266306924118226], [42.465972512881706]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[12.481312562873995], [41.89790148509894]],
-                            [[12.441770157800141], [43.936095834768004]],
-                            [[18.383001666953305], [43.850022398954934]],
-                            [[1.4479808571006174], [43.621904781004275]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[12.453386544971766], [41.903282179960115]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -5957,47 +5357,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.0649035208047554], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[1.5164859605055199], [42.5000014435459]],
-                            [[2.181424460619155], [41.385245438547486]],
-                            [[16.87275793322317], [41.114220396990845]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[-1.9219426455170492], [52.47691983637844]],
-                            [[11.34002070989385], [44.50042197578034]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[11.250000364841299], [43.780000833199324]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[8.93003861352986], [44.40998821926962]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[-0.11866770247593195], [51.5019405883275]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[4.828084616879835], [45.7719544229401]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[-2.249932961273487], [53.502361120562284]],
-                            [[5.3730642718298895], [43.29192492260455]],
-                            [[7.406913173465057], [43.73964568785249]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[14.243065492568519], [40.841971105863195]],
-                            [[2.33138946713035], [48.86863878981461]],
-                            [[19.266306924118226], [42.465972512881706]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[12.481312562873995], [41.89790148509894]],
-                            [[12.441770157800141], [43.936095834768004]],
-                            [[18.383001666953305], [43.850022398954934]],
-                            [[1.4479808571006174], [43.621904781004275]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[12.453386544971766], [41.903282179960115]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -6582,47 +5941,6 @@ plot_summary = {
                         "label": "",
                         "lines": [
                             [[0.012, 0.0649035208047554], [0.012, 0.012]],
-                            [[4.914694317400972], [52.35191454666443]],
-                            [[1.5164859605055199], [42.5000014435459]],
-                            [[2.181424460619155], [41.385245438547486]],
-                            [[16.87275793322317], [41.114220396990845]],
-                            [[13.399602764700546], [52.523764522251156]],
-                            [[7.466975462482424], [46.91668275866772]],
-                            [[-1.9219426455170492], [52.47691983637844]],
-                            [[11.34002070989385], [44.50042197578034]],
-                            [[17.11698075223461], [48.15001832996171]],
-                            [[4.33137074969045], [50.83526293533032]],
-                            [[19.081374818759684], [47.50195218499135]],
-                            [[18.64004024117304], [54.359975198476036]],
-                            [[4.2699613023134475], [52.08003684397488]],
-                            [[13.750002806257669], [51.04997051910084]],
-                            [[11.250000364841299], [43.780000833199324]],
-                            [[8.675015420169643], [50.09997682606331]],
-                            [[8.93003861352986], [44.40998821926962]],
-                            [[9.998053285520314], [53.55197049556244]],
-                            [[14.51496903347413], [46.0552883087945]],
-                            [[-0.11866770247593195], [51.5019405883275]],
-                            [[6.130002806227083], [49.611660379121076]],
-                            [[4.828084616879835], [45.7719544229401]],
-                            [[9.203063051142124], [45.47192105705352]],
-                            [[-2.249932961273487], [53.502361120562284]],
-                            [[5.3730642718298895], [43.29192492260455]],
-                            [[7.406913173465057], [43.73964568785249]],
-                            [[11.573047588912061], [48.131887894629244]],
-                            [[14.243065492568519], [40.841971105863195]],
-                            [[2.33138946713035], [48.86863878981461]],
-                            [[19.266306924118226], [42.465972512881706]],
-                            [[14.464033917048539], [50.08528287347832]],
-                            [[12.481312562873995], [41.89790148509894]],
-                            [[12.441770157800141], [43.936095834768004]],
-                            [[18.383001666953305], [43.850022398954934]],
-                            [[1.4479808571006174], [43.621904781004275]],
-                            [[7.668014629912079], [45.072333044356526]],
-                            [[9.516669472907267], [47.13372377429357]],
-                            [[12.453386544971766], [41.903282179960115]],
-                            [[16.364693096743736], [48.20196113681686]],
-                            [[15.999994668245677], [45.80000673327254]],
-                            [[8.548064271842577], [47.381933670993476]],
                             [
                                 [
                                     -9.949999809265137,
@@ -842,22 +842,58 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": 130.4080679344396,
-                    "p_lat": 33.59696113675858,
+                    "element_type": "markers",
+                    "p_lon": [
+                        130.40806579589844,
+                        136.76275634765625,
+                        132.4409637451172,
+                        130.3480682373047,
+                        130.96807861328125,
+                        135.12001037597656,
+                        135.748046875,
+                        133.5375213623047,
+                        131.4183807373047,
+                        138.1699981689453,
+                        129.88504028320312,
+                        136.9130401611328,
+                        141.33810424804688,
+                        141.019775390625,
+                        139.7494659423828,
+                        131.91001892089844,
+                        135.4582061767578,
+                    ],
+                    "p_lat": [
+                        33.596961975097656,
+                        35.423095703125,
+                        34.3897819519043,
+                        46.831966400146484,
+                        45.30190658569336,
+                        48.454986572265625,
+                        35.03193664550781,
+                        33.562435150146484,
+                        31.918243408203125,
+                        36.64999771118164,
+                        32.76498794555664,
+                        35.156944274902344,
+                        43.07692337036133,
+                        38.2890510559082,
+                        35.68696212768555,
+                        43.1300163269043,
+                        34.75197982788086,
+                    ],
                     "marker": "o",
                     "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Fukuoka",
-                    "xy": [130.4080679344396, 33.59696113675858],
+                    "xy": [130.40806579589844, 33.596961975097656],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -866,23 +902,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 136.76275264398942,
-                    "p_lat": 35.423094908686835,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Gifu",
-                    "xy": [136.76275264398942, 35.423094908686835],
+                    "xy": [136.76275634765625, 35.423095703125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -891,23 +914,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 132.44096710436975,
-                    "p_lat": 34.3897809609806,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Hiroshima",
-                    "xy": [132.44096710436975, 34.3897809609806],
+                    "xy": [132.4409637451172, 34.3897819519043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -916,23 +926,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 130.3480715965486,
-                    "p_lat": 46.83196724032729,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Jiamusi",
-                    "xy": [130.3480715965486, 46.83196724032729],
+                    "xy": [130.3480682373047, 46.831966400146484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -941,23 +938,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 130.96808543118652,
-                    "p_lat": 45.301905594813206,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Jixi",
-                    "xy": [130.96808543118652, 45.301905594813206],
+                    "xy": [130.96807861328125, 45.30190658569336],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -966,23 +950,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 135.12001053786298,
-                    "p_lat": 48.454986795132186,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Khabarovsk",
-                    "xy": [135.12001053786298, 48.454986795132186],
+                    "xy": [135.12001037597656, 48.454986572265625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -991,23 +962,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 135.7480520653204,
-                    "p_lat": 35.03193814685562,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kyoto",
-                    "xy": [135.7480520653204, 35.03193814685562],
+                    "xy": [135.748046875, 35.03193664550781],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1016,23 +974,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 133.53752315178895,
-                    "p_lat": 33.56243328758569,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kōchi",
-                    "xy": [133.53752315178895, 33.56243328758569],
+                    "xy": [133.5375213623047, 33.562435150146484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1041,23 +986,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 131.4183760163636,
-                    "p_lat": 31.918244241355012,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Miyazaki",
-                    "xy": [131.4183760163636, 31.918244241355012],
+                    "xy": [131.4183807373047, 31.918243408203125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1066,23 +998,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 138.17000524816171,
-                    "p_lat": 36.64999676416045,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Nagano",
-                    "xy": [138.17000524816171, 36.64999676416045],
+                    "xy": [138.1699981689453, 36.64999771118164],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1091,23 +1010,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 129.88503291739937,
-                    "p_lat": 32.76498842267364,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Nagasaki",
-                    "xy": [129.88503291739937, 32.76498842267364],
+                    "xy": [129.88504028320312, 32.76498794555664],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1116,23 +1022,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 136.91304555490842,
-                    "p_lat": 35.15694343656941,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Nagoya",
-                    "xy": [136.91304555490842, 35.15694343656941],
+                    "xy": [136.9130401611328, 35.156944274902344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1141,23 +1034,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 141.33809845206156,
-                    "p_lat": 43.07692512605422,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Sapporo",
-                    "xy": [141.33809845206156, 43.07692512605422],
+                    "xy": [141.33810424804688, 43.07692337036133],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1166,23 +1046,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 141.01977162914363,
-                    "p_lat": 38.28905199778001,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Sendai",
-                    "xy": [141.01977162914363, 38.28905199778001],
+                    "xy": [141.019775390625, 38.2890510559082],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1191,23 +1058,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 139.74946157054467,
-                    "p_lat": 35.686962764371174,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Tokyo",
-                    "xy": [139.74946157054467, 35.686962764371174],
+                    "xy": [139.7494659423828, 35.68696212768555],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1216,23 +1070,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 131.91002559318872,
-                    "p_lat": 43.130014667832256,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Vladivostok",
-                    "xy": [131.91002559318872, 43.130014667832256],
+                    "xy": [131.91001892089844, 43.1300163269043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1241,23 +1082,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 135.4581989565952,
-                    "p_lat": 34.75198107491417,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ōsaka",
-                    "xy": [135.4581989565952, 34.75198107491417],
+                    "xy": [135.4582061767578, 34.75197982788086],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1313,23 +1141,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -1982,23 +1793,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -2595,23 +2389,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -3729,23 +3506,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -5126,23 +4886,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -5711,23 +5454,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
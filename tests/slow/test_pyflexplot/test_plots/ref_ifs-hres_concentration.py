@@ -843,22 +843,58 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": 135.12001053786298,
-                    "p_lat": 48.454986795132186,
+                    "element_type": "markers",
+                    "p_lon": [
+                        135.12001037597656,
+                        130.40806579589844,
+                        136.76275634765625,
+                        132.4409637451172,
+                        130.3480682373047,
+                        130.96807861328125,
+                        135.748046875,
+                        133.5375213623047,
+                        131.4183807373047,
+                        138.1699981689453,
+                        129.88504028320312,
+                        136.9130401611328,
+                        139.7494659423828,
+                        141.33810424804688,
+                        141.019775390625,
+                        131.91001892089844,
+                        135.4582061767578,
+                    ],
+                    "p_lat": [
+                        48.454986572265625,
+                        33.596961975097656,
+                        35.423095703125,
+                        34.3897819519043,
+                        46.831966400146484,
+                        45.30190658569336,
+                        35.03193664550781,
+                        33.562435150146484,
+                        31.918243408203125,
+                        36.64999771118164,
+                        32.76498794555664,
+                        35.156944274902344,
+                        35.68696212768555,
+                        43.07692337036133,
+                        38.2890510559082,
+                        43.1300163269043,
+                        34.75197982788086,
+                    ],
                     "marker": "o",
                     "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Chabarowsk",
-                    "xy": [135.12001053786298, 48.454986795132186],
+                    "xy": [135.12001037597656, 48.454986572265625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -867,23 +903,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 130.4080679344396,
-                    "p_lat": 33.59696113675858,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Fukuoka",
-                    "xy": [130.4080679344396, 33.59696113675858],
+                    "xy": [130.40806579589844, 33.596961975097656],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -892,23 +915,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 136.76275264398942,
-                    "p_lat": 35.423094908686835,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Gifu",
-                    "xy": [136.76275264398942, 35.423094908686835],
+                    "xy": [136.76275634765625, 35.423095703125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -917,23 +927,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 132.44096710436975,
-                    "p_lat": 34.3897809609806,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Hiroshima",
-                    "xy": [132.44096710436975, 34.3897809609806],
+                    "xy": [132.4409637451172, 34.3897819519043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -942,23 +939,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 130.3480715965486,
-                    "p_lat": 46.83196724032729,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Jiamusi",
-                    "xy": [130.3480715965486, 46.83196724032729],
+                    "xy": [130.3480682373047, 46.831966400146484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -967,23 +951,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 130.96808543118652,
-                    "p_lat": 45.301905594813206,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Jixi",
-                    "xy": [130.96808543118652, 45.301905594813206],
+                    "xy": [130.96807861328125, 45.30190658569336],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -992,23 +963,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 135.7480520653204,
-                    "p_lat": 35.03193814685562,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kyōto",
-                    "xy": [135.7480520653204, 35.03193814685562],
+                    "xy": [135.748046875, 35.03193664550781],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1017,23 +975,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 133.53752315178895,
-                    "p_lat": 33.56243328758569,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kōchi",
-                    "xy": [133.53752315178895, 33.56243328758569],
+                    "xy": [133.5375213623047, 33.562435150146484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1042,23 +987,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 131.4183760163636,
-                    "p_lat": 31.918244241355012,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Miyazaki",
-                    "xy": [131.4183760163636, 31.918244241355012],
+                    "xy": [131.4183807373047, 31.918243408203125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1067,23 +999,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 138.17000524816171,
-                    "p_lat": 36.64999676416045,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Nagano",
-                    "xy": [138.17000524816171, 36.64999676416045],
+                    "xy": [138.1699981689453, 36.64999771118164],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1092,23 +1011,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 129.88503291739937,
-                    "p_lat": 32.76498842267364,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Nagasaki",
-                    "xy": [129.88503291739937, 32.76498842267364],
+                    "xy": [129.88504028320312, 32.76498794555664],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1117,23 +1023,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 136.91304555490842,
-                    "p_lat": 35.15694343656941,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Nagoya",
-                    "xy": [136.91304555490842, 35.15694343656941],
+                    "xy": [136.9130401611328, 35.156944274902344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1142,23 +1035,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 139.74946157054467,
-                    "p_lat": 35.686962764371174,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Präfektur Tokio",
-                    "xy": [139.74946157054467, 35.686962764371174],
+                    "xy": [139.7494659423828, 35.68696212768555],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1167,23 +1047,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 141.33809845206156,
-                    "p_lat": 43.07692512605422,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Sapporo",
-                    "xy": [141.33809845206156, 43.07692512605422],
+                    "xy": [141.33810424804688, 43.07692337036133],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1192,23 +1059,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 141.01977162914363,
-                    "p_lat": 38.28905199778001,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Sendai",
-                    "xy": [141.01977162914363, 38.28905199778001],
+                    "xy": [141.019775390625, 38.2890510559082],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1217,23 +1071,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 131.91002559318872,
-                    "p_lat": 43.130014667832256,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Wladiwostok",
-                    "xy": [131.91002559318872, 43.130014667832256],
+                    "xy": [131.91001892089844, 43.1300163269043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1242,23 +1083,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 135.4581989565952,
-                    "p_lat": 34.75198107491417,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ōsaka",
-                    "xy": [135.4581989565952, 34.75198107491417],
+                    "xy": [135.4582061767578, 34.75197982788086],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1325,23 +1153,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -1998,23 +1809,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -2615,23 +2409,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -3751,23 +3528,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -5152,23 +4912,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -5741,23 +5484,6 @@ plot_summary = {
                                 [0.021564929126657528, 0.05343507087334247],
                                 [0.012, 0.012],
                             ],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[130.4080679344396], [33.59696113675858]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[133.53752315178895], [33.56243328758569]],
-                            [[131.4183760163636], [31.918244241355012]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[129.88503291739937], [32.76498842267364]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[141.33809845206156], [43.07692512605422]],
-                            [[141.01977162914363], [38.28905199778001]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 178.375, 178.375, -179.375, -179.375],
                                 [-89.875, -89.875, 87.875, 87.875, -89.875],
@@ -852,22 +852,82 @@ plot_summary = {
             },
             "elements": [
                 {
-                    "element_type": "marker",
-                    "p_lon": 122.93808461735227,
-                    "p_lat": 41.11696724030418,
+                    "element_type": "markers",
+                    "p_lon": [
+                        122.9380874633789,
+                        129.0081024169922,
+                        135.12001037597656,
+                        125.33804321289062,
+                        118.94804382324219,
+                        127.42308044433594,
+                        121.62788391113281,
+                        136.76275634765625,
+                        126.90848541259766,
+                        126.64804077148438,
+                        132.4409637451172,
+                        130.3480682373047,
+                        126.548095703125,
+                        130.96807861328125,
+                        135.748046875,
+                        120.82803344726562,
+                        138.1699981689453,
+                        136.9130401611328,
+                        125.75274658203125,
+                        139.7494659423828,
+                        120.32806396484375,
+                        123.98804473876953,
+                        126.99778747558594,
+                        123.44802856445312,
+                        131.91001892089844,
+                        127.43081665039062,
+                        121.39807891845703,
+                        118.04804992675781,
+                        135.4582061767578,
+                    ],
+                    "p_lat": [
+                        41.116966247558594,
+                        35.09700012207031,
+                        48.454986572265625,
+                        43.8669548034668,
+                        42.2719612121582,
+                        36.33749008178711,
+                        38.92478561401367,
+                        35.423095703125,
+                        35.17291259765625,
+                        45.751930236816406,
+                        34.3897819519043,
+                        46.831966400146484,
+                        43.8519172668457,
+                        45.30190658569336,
+                        35.03193664550781,
+                        40.75228500366211,
+                        36.64999771118164,
+                        35.156944274902344,
+                        39.021385192871094,
+                        35.68696212768555,
+                        36.09192657470703,
+                        47.346923828125,
+                        37.568294525146484,
+                        41.80692672729492,
+                        43.1300163269043,
+                        39.16048812866211,
+                        37.532352447509766,
+                        36.80193328857422,
+                        34.75197982788086,
+                    ],
                     "marker": "o",
                     "transform": "PlateCarree instance",
                     "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
+                    "s": 9.0,
+                    "facecolors": "none",
+                    "edgecolors": "black",
+                    "linewidths": 1.0,
                     "rasterized": False,
                 },
                 {
                     "element_type": "text",
                     "s": "Anshan",
-                    "xy": [122.93808461735227, 41.11696724030418],
+                    "xy": [122.9380874633789, 41.116966247558594],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -876,23 +936,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 129.00810170722048,
-                    "p_lat": 35.09699877511093,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Busan",
-                    "xy": [129.00810170722048, 35.09699877511093],
+                    "xy": [129.0081024169922, 35.09700012207031],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -901,23 +948,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 135.12001053786298,
-                    "p_lat": 48.454986795132186,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Chabarowsk",
-                    "xy": [135.12001053786298, 48.454986795132186],
+                    "xy": [135.12001037597656, 48.454986572265625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -926,23 +960,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 125.33804148585148,
-                    "p_lat": 43.86695442293251,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Changchun",
-                    "xy": [125.33804148585148, 43.86695442293251],
+                    "xy": [125.33804321289062, 43.8669548034668],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -951,23 +972,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 118.94804392723222,
-                    "p_lat": 42.27196134024399,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Chifeng",
-                    "xy": [118.94804392723222, 42.27196134024399],
+                    "xy": [118.94804382324219, 42.2719612121582],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -976,23 +984,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 127.42308217596405,
-                    "p_lat": 36.33749153227734,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Daejeon",
-                    "xy": [127.42308217596405, 36.33749153227734],
+                    "xy": [127.42308044433594, 36.33749008178711],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1001,23 +996,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 121.62788497900601,
-                    "p_lat": 38.92478425181571,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Dalian",
-                    "xy": [121.62788497900601, 38.92478425181571],
+                    "xy": [121.62788391113281, 38.92478561401367],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1026,23 +1008,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 136.76275264398942,
-                    "p_lat": 35.423094908686835,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Gifu",
-                    "xy": [136.76275264398942, 35.423094908686835],
+                    "xy": [136.76275634765625, 35.423095703125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1051,23 +1020,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 126.90848826320143,
-                    "p_lat": 35.17291145414782,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Gwangju",
-                    "xy": [126.90848826320143, 35.17291145414782],
+                    "xy": [126.90848541259766, 35.17291259765625],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1076,23 +1032,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 126.64803904445057,
-                    "p_lat": 45.75192980542715,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Harbin",
-                    "xy": [126.64803904445057, 45.75192980542715],
+                    "xy": [126.64804077148438, 45.751930236816406],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1101,23 +1044,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 132.44096710436975,
-                    "p_lat": 34.3897809609806,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Hiroshima",
-                    "xy": [132.44096710436975, 34.3897809609806],
+                    "xy": [132.4409637451172, 34.3897819519043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1126,23 +1056,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 130.3480715965486,
-                    "p_lat": 46.83196724032729,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Jiamusi",
-                    "xy": [130.3480715965486, 46.83196724032729],
+                    "xy": [130.3480682373047, 46.831966400146484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1151,23 +1068,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 126.54809682439804,
-                    "p_lat": 43.85191658113547,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Jilin",
-                    "xy": [126.54809682439804, 43.85191658113547],
+                    "xy": [126.548095703125, 43.8519172668457],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1176,23 +1080,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 130.96808543118652,
-                    "p_lat": 45.301905594813206,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Jixi",
-                    "xy": [130.96808543118652, 45.301905594813206],
+                    "xy": [130.96807861328125, 45.30190658569336],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1201,23 +1092,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 135.7480520653204,
-                    "p_lat": 35.03193814685562,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Kyōto",
-                    "xy": [135.7480520653204, 35.03193814685562],
+                    "xy": [135.748046875, 35.03193664550781],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1226,23 +1104,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 120.82803253401062,
-                    "p_lat": 40.75228665762057,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Lianshan",
-                    "xy": [120.82803253401062, 40.75228665762057],
+                    "xy": [120.82803344726562, 40.75228500366211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1251,23 +1116,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 138.17000524816171,
-                    "p_lat": 36.64999676416045,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Nagano",
-                    "xy": [138.17000524816171, 36.64999676416045],
+                    "xy": [138.1699981689453, 36.64999771118164],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1276,23 +1128,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 136.91304555490842,
-                    "p_lat": 35.15694343656941,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Nagoya",
-                    "xy": [136.91304555490842, 35.15694343656941],
+                    "xy": [136.9130401611328, 35.156944274902344],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1301,23 +1140,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 125.75274485499392,
-                    "p_lat": 39.02138455800434,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Pjöngjang",
-                    "xy": [125.75274485499392, 39.02138455800434],
+                    "xy": [125.75274658203125, 39.021385192871094],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1326,23 +1152,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 139.74946157054467,
-                    "p_lat": 35.686962764371174,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Präfektur Tokio",
-                    "xy": [139.74946157054467, 35.686962764371174],
+                    "xy": [139.7494659423828, 35.68696212768555],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1351,23 +1164,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 120.32806305158692,
-                    "p_lat": 36.09192512602641,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Qingdao",
-                    "xy": [120.32806305158692, 36.09192512602641],
+                    "xy": [120.32806396484375, 36.09192657470703],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1376,23 +1176,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 123.9880463686585,
-                    "p_lat": 47.34692288811567,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Qiqihar",
-                    "xy": [123.9880463686585, 47.34692288811567],
+                    "xy": [123.98804473876953, 47.346923828125],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1401,23 +1188,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 126.99778513820195,
-                    "p_lat": 37.56829495838895,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Seoul",
-                    "xy": [126.99778513820195, 37.56829495838895],
+                    "xy": [126.99778747558594, 37.568294525146484],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1426,23 +1200,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 123.44802765120869,
-                    "p_lat": 41.80692512604918,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Shenyang",
-                    "xy": [123.44802765120869, 41.80692512604918],
+                    "xy": [123.44802856445312, 41.80692672729492],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1451,23 +1212,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 131.91002559318872,
-                    "p_lat": 43.130014667832256,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Wladiwostok",
-                    "xy": [131.91002559318872, 43.130014667832256],
+                    "xy": [131.91001892089844, 43.1300163269043],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1476,23 +1224,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 127.4308157949938,
-                    "p_lat": 39.1604895213319,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Wŏnsan",
-                    "xy": [127.4308157949938, 39.1604895213319],
+                    "xy": [127.43081665039062, 39.16048812866211],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1501,23 +1236,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 121.39807525862216,
-                    "p_lat": 37.532353999730105,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Yantai",
-                    "xy": [121.39807525862216, 37.532353999730105],
+                    "xy": [121.39807891845703, 37.532352447509766],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1526,23 +1248,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 118.04804718243702,
-                    "p_lat": 36.80193346750053,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Zibo",
-                    "xy": [118.04804718243702, 36.80193346750053],
+                    "xy": [118.04804992675781, 36.80193328857422],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1551,23 +1260,10 @@ plot_summary = {
                     "size": 9.0,
                     "rasterized": False,
                 },
-                {
-                    "element_type": "marker",
-                    "p_lon": 135.4581989565952,
-                    "p_lat": 34.75198107491417,
-                    "marker": "o",
-                    "transform": "PlateCarree instance",
-                    "zorder": 4,
-                    "color": "black",
-                    "fillstyle": "none",
-                    "markeredgewidth": 1.0,
-                    "markersize": 3.0,
-                    "rasterized": False,
-                },
                 {
                     "element_type": "text",
                     "s": "Ōsaka",
-                    "xy": [135.4581989565952, 34.75198107491417],
+                    "xy": [135.4582061767578, 34.75197982788086],
                     "xycoords": "CompositeGenericTransform instance",
                     "zorder": 3,
                     "xytext": [5, 1],
@@ -1634,35 +1330,6 @@ plot_summary = {
                                 [0.013151577503429351, 0.061848422496570646],
                                 [0.012, 0.012],
                             ],
-                            [[122.93808461735227], [41.11696724030418]],
-                            [[129.00810170722048], [35.09699877511093]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[125.33804148585148], [43.86695442293251]],
-                            [[118.94804392723222], [42.27196134024399]],
-                            [[127.42308217596405], [36.33749153227734]],
-                            [[121.62788497900601], [38.92478425181571]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[126.90848826320143], [35.17291145414782]],
-                            [[126.64803904445057], [45.75192980542715]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[126.54809682439804], [43.85191658113547]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[120.82803253401062], [40.75228665762057]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[125.75274485499392], [39.02138455800434]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[120.32806305158692], [36.09192512602641]],
-                            [[123.9880463686585], [47.34692288811567]],
-                            [[126.99778513820195], [37.56829495838895]],
-                            [[123.44802765120869], [41.80692512604918]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[127.4308157949938], [39.1604895213319]],
-                            [[121.39807525862216], [37.532353999730105]],
-                            [[118.04804718243702], [36.80193346750053]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 173.125, 173.125, -179.375, -179.375],
                                 [-89.875, -89.875, 82.625, 82.625, -89.875],
@@ -2322,35 +1989,6 @@ plot_summary = {
                                 [0.013151577503429351, 0.061848422496570646],
                                 [0.012, 0.012],
                             ],
-                            [[122.93808461735227], [41.11696724030418]],
-                            [[129.00810170722048], [35.09699877511093]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[125.33804148585148], [43.86695442293251]],
-                            [[118.94804392723222], [42.27196134024399]],
-                            [[127.42308217596405], [36.33749153227734]],
-                            [[121.62788497900601], [38.92478425181571]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[126.90848826320143], [35.17291145414782]],
-                            [[126.64803904445057], [45.75192980542715]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[126.54809682439804], [43.85191658113547]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[120.82803253401062], [40.75228665762057]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[125.75274485499392], [39.02138455800434]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[120.32806305158692], [36.09192512602641]],
-                            [[123.9880463686585], [47.34692288811567]],
-                            [[126.99778513820195], [37.56829495838895]],
-                            [[123.44802765120869], [41.80692512604918]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[127.4308157949938], [39.1604895213319]],
-                            [[121.39807525862216], [37.532353999730105]],
-                            [[118.04804718243702], [36.80193346750053]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 173.125, 173.125, -179.375, -179.375],
                                 [-89.875, -89.875, 82.625, 82.625, -89.875],
@@ -2954,35 +2592,6 @@ plot_summary = {
                                 [0.013151577503429351, 0.061848422496570646],
                                 [0.012, 0.012],
                             ],
-                            [[122.93808461735227], [41.11696724030418]],
-                            [[129.00810170722048], [35.09699877511093]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[125.33804148585148], [43.86695442293251]],
-                            [[118.94804392723222], [42.27196134024399]],
-                            [[127.42308217596405], [36.33749153227734]],
-                            [[121.62788497900601], [38.92478425181571]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[126.90848826320143], [35.17291145414782]],
-                            [[126.64803904445057], [45.75192980542715]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[126.54809682439804], [43.85191658113547]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[120.82803253401062], [40.75228665762057]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[125.75274485499392], [39.02138455800434]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[120.32806305158692], [36.09192512602641]],
-                            [[123.9880463686585], [47.34692288811567]],
-                            [[126.99778513820195], [37.56829495838895]],
-                            [[123.44802765120869], [41.80692512604918]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[127.4308157949938], [39.1604895213319]],
-                            [[121.39807525862216], [37.532353999730105]],
-                            [[118.04804718243702], [36.80193346750053]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 173.125, 173.125, -179.375, -179.375],
                                 [-89.875, -89.875, 82.625, 82.625, -89.875],
@@ -4160,35 +3769,6 @@ plot_summary = {
                                 [0.013151577503429351, 0.061848422496570646],
                                 [0.012, 0.012],
                             ],
-                            [[122.93808461735227], [41.11696724030418]],
-                            [[129.00810170722048], [35.09699877511093]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[125.33804148585148], [43.86695442293251]],
-                            [[118.94804392723222], [42.27196134024399]],
-                            [[127.42308217596405], [36.33749153227734]],
-                            [[121.62788497900601], [38.92478425181571]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[126.90848826320143], [35.17291145414782]],
-                            [[126.64803904445057], [45.75192980542715]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[126.54809682439804], [43.85191658113547]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[120.82803253401062], [40.75228665762057]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[125.75274485499392], [39.02138455800434]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[120.32806305158692], [36.09192512602641]],
-                            [[123.9880463686585], [47.34692288811567]],
-                            [[126.99778513820195], [37.56829495838895]],
-                            [[123.44802765120869], [41.80692512604918]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[127.4308157949938], [39.1604895213319]],
-                            [[121.39807525862216], [37.532353999730105]],
-                            [[118.04804718243702], [36.80193346750053]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 173.125, 173.125, -179.375, -179.375],
                                 [-89.875, -89.875, 82.625, 82.625, -89.875],
@@ -5576,35 +5156,6 @@ plot_summary = {
                                 [0.013151577503429351, 0.061848422496570646],
                                 [0.012, 0.012],
                             ],
-                            [[122.93808461735227], [41.11696724030418]],
-                            [[129.00810170722048], [35.09699877511093]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[125.33804148585148], [43.86695442293251]],
-                            [[118.94804392723222], [42.27196134024399]],
-                            [[127.42308217596405], [36.33749153227734]],
-                            [[121.62788497900601], [38.92478425181571]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[126.90848826320143], [35.17291145414782]],
-                            [[126.64803904445057], [45.75192980542715]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[126.54809682439804], [43.85191658113547]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[120.82803253401062], [40.75228665762057]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[125.75274485499392], [39.02138455800434]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[120.32806305158692], [36.09192512602641]],
-                            [[123.9880463686585], [47.34692288811567]],
-                            [[126.99778513820195], [37.56829495838895]],
-                            [[123.44802765120869], [41.80692512604918]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[127.4308157949938], [39.1604895213319]],
-                            [[121.39807525862216], [37.532353999730105]],
-                            [[118.04804718243702], [36.80193346750053]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 173.125, 173.125, -179.375, -179.375],
                                 [-89.875, -89.875, 82.625, 82.625, -89.875],
@@ -6180,35 +5731,6 @@ plot_summary = {
                                 [0.013151577503429351, 0.061848422496570646],
                                 [0.012, 0.012],
                             ],
-                            [[122.93808461735227], [41.11696724030418]],
-                            [[129.00810170722048], [35.09699877511093]],
-                            [[135.12001053786298], [48.454986795132186]],
-                            [[125.33804148585148], [43.86695442293251]],
-                            [[118.94804392723222], [42.27196134024399]],
-                            [[127.42308217596405], [36.33749153227734]],
-                            [[121.62788497900601], [38.92478425181571]],
-                            [[136.76275264398942], [35.423094908686835]],
-                            [[126.90848826320143], [35.17291145414782]],
-                            [[126.64803904445057], [45.75192980542715]],
-                            [[132.44096710436975], [34.3897809609806]],
-                            [[130.3480715965486], [46.83196724032729]],
-                            [[126.54809682439804], [43.85191658113547]],
-                            [[130.96808543118652], [45.301905594813206]],
-                            [[135.7480520653204], [35.03193814685562]],
-                            [[120.82803253401062], [40.75228665762057]],
-                            [[138.17000524816171], [36.64999676416045]],
-                            [[136.91304555490842], [35.15694343656941]],
-                            [[125.75274485499392], [39.02138455800434]],
-                            [[139.74946157054467], [35.686962764371174]],
-                            [[120.32806305158692], [36.09192512602641]],
-                            [[123.9880463686585], [47.34692288811567]],
-                            [[126.99778513820195], [37.56829495838895]],
-                            [[123.44802765120869], [41.80692512604918]],
-                            [[131.91002559318872], [43.130014667832256]],
-                            [[127.4308157949938], [39.1604895213319]],
-                            [[121.39807525862216], [37.532353999730105]],
-                            [[118.04804718243702], [36.80193346750053]],
-                            [[135.4581989565952], [34.75198107491417]],
                             [
                                 [-179.375, 173.125, 173.125, -179.375, -179.375],
                                 [-89.875, -89.875, 82.625, 82.625, -89.875],